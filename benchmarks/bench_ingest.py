@@ -0,0 +1,235 @@
+"""Throughput benchmark for the Hummingbot MQTT ingest path.
+
+Usage:
+    python benchmarks/bench_ingest.py [--instances 1 10 100 1000] [--messages 20000]
+
+Requires Home Assistant to be importable. The running pieces of Home Assistant
+are replaced with the stand-ins from ha_stubs.py: `hass` is a stub object, the
+entity registry lookup returns an empty registry, MQTT goes through an
+in-process broker and entity state writes are only counted. Entities are
+created through the real discovery callbacks and become ready through
+`async_added_to_hass`.
+
+For each instance count a synthetic stream of heartbeats, order created and
+cancelled events, status notifications and log lines is routed through
+`HbotManager.async_route_mqtt_message`, then `async_process_entity_mqtt_discovery`
+and `HbotInstance.update_data` are timed on their own. The report lists
+messages per second, p50/p99 time per callback, net memory blocks retained per
+message and the tracemalloc peak for the run.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+from ha_stubs import (
+    DISCOVER_ENTITIES,
+    LocalMqttBroker,
+    StubHass,
+    StubMessage,
+    async_setup_integration,
+    coordinator,
+    percentile,
+    stub_home_assistant,
+)
+
+CORPUS = pathlib.Path(__file__).resolve().parent / "status_corpus"
+
+
+def build_stream(instance_ids: list[str], total_messages: int) -> list[StubMessage]:
+    status_text = (CORPUS / "pure_market_making.txt").read_text()
+    status_payload = json.dumps({"msg": status_text})
+    log_payload = json.dumps({"msg": "Order BUY-ETH-USDT-1684000000 has been filled.", "level_name": "INFO"})
+    hb_payload = json.dumps({"ts": 1684000000})
+    order_ids = itertools.count()
+    last_order_ids = dict()
+    messages = list()
+
+    cycle = ["hb"] * 5 + ["create", "cancel"] * 6 + ["status"] + ["log"] * 4
+
+    for step in itertools.cycle(cycle):
+        for instance_id in instance_ids:
+            if step == "hb":
+                messages.append(StubMessage(f"hbot/{instance_id}/hb", hb_payload))
+
+            elif step == "create":
+                order_id = last_order_ids[instance_id] = f"{instance_id}-{next(order_ids)}"
+                messages.append(StubMessage(f"hbot/{instance_id}/events", json.dumps({
+                    "timestamp": 1684000000000,
+                    "type": "BuyOrderCreated",
+                    "data": {
+                        "order_id": order_id,
+                        "type": "OrderType.LIMIT",
+                        "trading_pair": "ETH-USDT",
+                        "amount": "0.25",
+                        "price": "1802.32",
+                        "creation_timestamp": 1684000000000,
+                        "exchange_order_id": None,
+                        "leverage": 1,
+                        "position": "NIL",
+                    },
+                })))
+
+            elif step == "cancel":
+                order_id = last_order_ids.pop(instance_id, "")
+                messages.append(StubMessage(f"hbot/{instance_id}/events", json.dumps({
+                    "timestamp": 1684000000000,
+                    "type": "OrderCancelled",
+                    "data": {"order_id": order_id, "exchange_order_id": None},
+                })))
+
+            elif step == "status":
+                messages.append(StubMessage(f"hbot/{instance_id}/notify", status_payload))
+
+            else:
+                messages.append(StubMessage(f"hbot/{instance_id}/log", log_payload))
+
+            if len(messages) >= total_messages:
+                return messages
+
+    return messages
+
+
+async def async_setup_fleet(
+    hass: StubHass, manager: coordinator.HbotManager, pending_adds: list, instance_ids: list[str]
+) -> None:
+    for instance_id in instance_ids:
+        manager.async_route_mqtt_message(hass, StubMessage(f"hbot/{instance_id}/hb", '{"ts": 1}'))
+
+    await async_finish_pending_adds(pending_adds)
+
+    started = json.dumps({"msg": "\nstrategy started.\n"})
+
+    for instance_id in instance_ids:
+        manager.async_route_mqtt_message(hass, StubMessage(f"hbot/{instance_id}/notify", started))
+
+
+async def async_finish_pending_adds(pending_adds: list) -> None:
+    """Let entities discovered during a timed pass finish being added while the stubs are in place."""
+    await asyncio.gather(*pending_adds)
+    pending_adds.clear()
+
+
+def run_route(hass: StubHass, manager: coordinator.HbotManager, messages: list[StubMessage]) -> tuple[float, list[int]]:
+    samples = list()
+    perf_counter_ns = time.perf_counter_ns
+    route = manager.async_route_mqtt_message
+
+    start = perf_counter_ns()
+    for msg in messages:
+        t0 = perf_counter_ns()
+        route(hass, msg)
+        samples.append(perf_counter_ns() - t0)
+    elapsed = (perf_counter_ns() - start) / 1e9
+
+    return elapsed, samples
+
+
+def run_discovery(hass: StubHass, manager: coordinator.HbotManager, instances: list, rounds: int) -> tuple[float, list[int]]:
+    samples = list()
+    perf_counter_ns = time.perf_counter_ns
+
+    start = perf_counter_ns()
+    for _ in range(rounds):
+        for hbot_instance in instances:
+            for discover in DISCOVER_ENTITIES:
+                t0 = perf_counter_ns()
+                manager.async_process_entity_mqtt_discovery(hass, hbot_instance, discover, lambda *args: None)
+                samples.append(perf_counter_ns() - t0)
+    elapsed = (perf_counter_ns() - start) / 1e9
+
+    return elapsed, samples
+
+
+def run_update_data(instances_by_id: dict, messages: list[StubMessage]) -> tuple[float, list[int]]:
+    decoded = list()
+
+    for msg in messages:
+        _, instance_id, endpoint = msg.topic.split("/")
+        if endpoint != "hb":
+            decoded.append((instances_by_id[instance_id], endpoint, json.loads(msg.payload)))
+
+    samples = list()
+    perf_counter_ns = time.perf_counter_ns
+
+    start = perf_counter_ns()
+    for hbot_instance, endpoint, event in decoded:
+        t0 = perf_counter_ns()
+        hbot_instance.update_data(endpoint, event)
+        samples.append(perf_counter_ns() - t0)
+    elapsed = (perf_counter_ns() - start) / 1e9
+
+    return elapsed, samples
+
+
+def report(instance_count: int, path: str, elapsed: float, samples: list[int], extra: str = "") -> None:
+    rate = len(samples) / elapsed if elapsed else 0.0
+    print(
+        f"{instance_count:>9} {path:<28} {len(samples):>8} {rate:>12.0f} "
+        f"{percentile(samples, 50):>9.1f} {percentile(samples, 99):>9.1f} {extra}"
+    )
+
+
+async def async_bench(instance_count: int, total_messages: int) -> None:
+    hass = StubHass(asyncio.get_running_loop())
+    broker = LocalMqttBroker()
+
+    with stub_home_assistant(broker, {"max_instances": instance_count}) as write_counter:
+        manager, pending_adds = async_setup_integration(hass, broker)
+        manager.set_state_write_interval(0)
+
+        instance_ids = [f"bot{i:04d}" for i in range(instance_count)]
+        await async_setup_fleet(hass, manager, pending_adds, instance_ids)
+
+        instances_by_id = {instance_id: manager._get_hbot_instance(hass, instance_id) for instance_id in instance_ids}
+        messages = build_stream(instance_ids, total_messages)
+
+        writes_before = write_counter.writes
+        blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        elapsed, samples = run_route(hass, manager, messages)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        blocks_per_msg = (sys.getallocatedblocks() - blocks_before) / len(messages)
+        writes = write_counter.writes - writes_before
+        await async_finish_pending_adds(pending_adds)
+
+        # Second, untraced pass for timings free of tracemalloc overhead.
+        elapsed, samples = run_route(hass, manager, build_stream(instance_ids, total_messages))
+        await async_finish_pending_adds(pending_adds)
+        report(
+            instance_count, "async_route_mqtt_message", elapsed, samples,
+            f"{blocks_per_msg:>10.2f} {peak / 1024:>9.0f} {writes:>8}",
+        )
+
+        elapsed, samples = run_discovery(hass, manager, list(instances_by_id.values()), max(1, total_messages // (instance_count * 3)))
+        report(instance_count, "entity_mqtt_discovery", elapsed, samples)
+
+        elapsed, samples = run_update_data(instances_by_id, build_stream(instance_ids, total_messages))
+        await async_finish_pending_adds(pending_adds)
+        report(instance_count, "HbotInstance.update_data", elapsed, samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(
+        f"{'instances':>9} {'path':<28} {'messages':>8} {'msgs/s':>12} {'p50 us':>9} {'p99 us':>9} "
+        f"{'blocks/msg':>10} {'peak KiB':>9} {'writes':>8}"
+    )
+
+    for instance_count in args.instances:
+        asyncio.run(async_bench(instance_count, args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark the Hummingbot status parser against the status corpus.
+
+Usage:
+    python benchmarks/bench_status_parser.py [--iterations N]
+
+Each file in benchmarks/status_corpus is parsed with status_parser.parse_status
+and with the line/column walk that update_data used before the parser existed.
+The parser module has no Home Assistant imports, so it is loaded straight from
+its file and the benchmark runs without a Home Assistant install.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import pathlib
+import sys
+import timeit
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+CORPUS = pathlib.Path(__file__).resolve().parent / "status_corpus"
+PARSER_PATH = ROOT / "custom_components" / "hummingbot" / "status_parser.py"
+
+
+def load_status_parser():
+    spec = importlib.util.spec_from_file_location("hbot_status_parser", PARSER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_parse_status(msg: str) -> dict:
+    result = dict()
+    status_lines = [line.strip().split() for line in msg.split("\n") if len(line)]
+    for i, cols in enumerate(status_lines):
+
+        if cols[0] == "Assets:":
+            result["base"] = status_lines[i + 1][0]
+            result["quote"] = status_lines[i + 1][1]
+
+        if len(cols) < 2:
+            continue
+
+        if cols[0] == "Total":
+            result["total"] = (cols[2], cols[3])
+
+        elif cols[0] == "Available":
+            result["available"] = (cols[2], cols[3])
+
+        elif cols[0] == "Exchange":
+            cols = status_lines[i + 1]
+            result["prices"] = (cols[2], cols[3], cols[4])
+
+    return result
+
+
+def bench(func, text: str, iterations: int) -> tuple[float | None, str]:
+    try:
+        func(text)
+    except Exception as e:
+        return None, type(e).__name__
+
+    seconds = min(timeit.repeat(lambda: func(text), number=iterations, repeat=5))
+
+    return seconds / iterations * 1e6, ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    status_parser = load_status_parser()
+
+    print(f"{'corpus file':<36} {'bytes':>6} {'markets':>7} {'balances':>8} {'parser us':>10} {'legacy us':>10}")
+
+    for path in sorted(CORPUS.glob("*.txt")):
+        text = path.read_text()
+        status = status_parser.parse_status(text)
+        parser_us, _ = bench(status_parser.parse_status, text, args.iterations)
+        legacy_us, legacy_error = bench(legacy_parse_status, text, args.iterations)
+        legacy = f"{legacy_us:10.1f}" if legacy_us is not None else f"{legacy_error:>10}"
+
+        print(
+            f"{path.name:<36} {len(text):>6} {len(status.markets):>7} {len(status.balances):>8} "
+            f"{parser_us:10.1f} {legacy}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Light Home Assistant stand-ins shared by the benchmark and replay tools.
+
+Requires Home Assistant to be importable: the integration code runs unchanged,
+only the running hass object, the entity registry, MQTT and entity state
+writes are replaced.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import pathlib
+import sys
+from collections.abc import Callable, Iterator
+from unittest import mock
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT))
+
+from homeassistant import config_entries  # noqa: E402
+
+from custom_components.hummingbot import (  # noqa: E402
+    hummingbot_coordinator as coordinator,
+)
+from custom_components.hummingbot.base import HbotBase  # noqa: E402
+from custom_components.hummingbot.binary_sensor import (  # noqa: E402
+    discover_binary_sensors,
+)
+from custom_components.hummingbot.button import discover_buttons  # noqa: E402
+from custom_components.hummingbot.sensor import discover_sensors  # noqa: E402
+
+DISCOVER_ENTITIES = (discover_binary_sensors, discover_buttons, discover_sensors)
+
+
+class StubConfigEntry:
+    def __init__(self, options: dict | None = None):
+        self.options = options or dict()
+
+
+class StubEntityRegistry:
+    def __init__(self):
+        self.entities = dict()
+
+
+class StubHass:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.data = dict()
+
+
+class StubMessage:
+    __slots__ = ("topic", "payload")
+
+    def __init__(self, topic: str, payload: str):
+        self.topic = topic
+        self.payload = payload
+
+
+class StateWriteCounter:
+    def __init__(self):
+        self.writes = 0
+
+    def __call__(self, entity: HbotBase) -> None:
+        self.writes += 1
+
+
+def topic_matches(topic_filter: str, topic: str) -> bool:
+    filter_parts = topic_filter.split("/")
+    topic_parts = topic.split("/")
+
+    for i, part in enumerate(filter_parts):
+        if part == "#":
+            return True
+
+        if i >= len(topic_parts) or (part != "+" and part != topic_parts[i]):
+            return False
+
+    return len(filter_parts) == len(topic_parts)
+
+
+class LocalMqttBroker:
+    """In-process stand-in for the MQTT integration."""
+
+    def __init__(self):
+        self._subscriptions = list()
+        self.published = 0
+
+    def subscribe(self, topic_filter: str, msg_callback: Callable[[StubMessage], None]) -> Callable[[], None]:
+        subscription = (topic_filter, msg_callback)
+        self._subscriptions.append(subscription)
+
+        return lambda: self._subscriptions.remove(subscription)
+
+    def publish(self, hass: StubHass, topic: str, payload: str, qos: int = 0, retain: bool = False) -> None:
+        self.published += 1
+        self.deliver(topic, payload)
+
+    def deliver(self, topic: str, payload: str) -> None:
+        msg = None
+
+        for topic_filter, msg_callback in self._subscriptions:
+            if topic_matches(topic_filter, topic):
+                msg = msg or StubMessage(topic, payload)
+                msg_callback(msg)
+
+
+@contextlib.contextmanager
+def stub_home_assistant(broker: LocalMqttBroker, options: dict | None = None) -> Iterator[StateWriteCounter]:
+    """Patch the integration to run against stubs and reset the manager around it."""
+    write_counter = StateWriteCounter()
+    config_entries.current_entry.set(StubConfigEntry(options))
+
+    with (
+        mock.patch.object(coordinator.er, "async_get", lambda hass: StubEntityRegistry()),
+        mock.patch.object(coordinator, "mqtt", broker),
+        mock.patch.object(HbotBase, "async_write_ha_state", lambda self: write_counter(self)),
+    ):
+        coordinator.HbotManager.unload()
+        try:
+            yield write_counter
+        finally:
+            coordinator.HbotManager.unload()
+
+
+def async_setup_integration(hass: StubHass, broker: LocalMqttBroker) -> tuple[coordinator.HbotManager, list[asyncio.Task]]:
+    """Wire the manager up the way async_setup_entry does.
+
+    Returns the manager and the list that collects entity add tasks, await
+    them to let newly discovered instances become ready.
+    """
+    manager = coordinator.HbotManager.instance()
+    manager.update_with_config_entry()
+    pending_adds = list()
+
+    def async_add_entities(entities, update_before_add=False) -> None:
+        for entity in entities:
+            pending_adds.append(hass.loop.create_task(entity.async_added_to_hass()))
+
+    for discover in DISCOVER_ENTITIES:
+        manager.async_register_entity_discovery(discover, async_add_entities)
+
+    for topic in manager.subscription_topics:
+        broker.subscribe(topic, lambda msg: manager.async_route_mqtt_message(hass, msg))
+
+    return manager, pending_adds
+
+
+def percentile(samples: list[int], pct: float) -> float:
+    """Return the percentile of nanosecond samples, in microseconds."""
+    if not samples:
+        return 0.0
+
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+
+    return ordered[index] / 1000
@@ -0,0 +1,203 @@
+"""Record live Hummingbot MQTT traffic and replay it into the integration.
+
+Usage:
+    python benchmarks/hbot_replay.py record OUTPUT [--host H] [--port P] [--username U]
+                                     [--password PW] [--topic hbot/#] [--duration SECONDS]
+    python benchmarks/hbot_replay.py replay RECORDING [--speed N] [--fan-out K]
+
+`record` needs paho-mqtt (installed alongside the Home Assistant MQTT
+integration). Messages are written to a gzip compressed JSON lines file: a
+header line followed by one `[seconds since start, topic, payload]` line per
+message.
+
+`replay` needs Home Assistant to be importable and runs the integration
+against the stand-ins from ha_stubs.py, delivering the recording through the
+in-process broker. `--speed 1` replays in real time, `--speed N` N times
+faster and `--speed 0` as fast as possible. `--fan-out K` delivers every
+message to K synthetic instances (`<instance_id>-<k>`) to model a larger fleet.
+The report covers callback time per message, event loop utilisation, event
+loop lag, state writes and commands published by the integration.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import pathlib
+import threading
+import time
+
+RECORDING_FORMAT = "hbot-recording"
+RECORDING_VERSION = 1
+LAG_MONITOR_INTERVAL = 0.05
+
+
+def record(args: argparse.Namespace) -> None:
+    import paho.mqtt.client as paho
+
+    if hasattr(paho, "CallbackAPIVersion"):
+        client = paho.Client(paho.CallbackAPIVersion.VERSION2)
+    else:
+        client = paho.Client()
+
+    if args.username:
+        client.username_pw_set(args.username, args.password)
+
+    lock = threading.Lock()
+    started = time.monotonic()
+    count = 0
+
+    with gzip.open(args.output, "wt", encoding="utf-8") as recording:
+        recording.write(json.dumps({"format": RECORDING_FORMAT, "version": RECORDING_VERSION, "started": time.time()}) + "\n")
+
+        def on_message(client, userdata, msg) -> None:
+            nonlocal count
+            line = json.dumps([
+                round(time.monotonic() - started, 6),
+                msg.topic,
+                msg.payload.decode("utf-8", errors="replace"),
+            ], separators=(",", ":"))
+
+            with lock:
+                recording.write(line + "\n")
+                count += 1
+
+        client.on_message = on_message
+        client.connect(args.host, args.port)
+        client.subscribe(args.topic)
+        client.loop_start()
+
+        try:
+            if args.duration:
+                time.sleep(args.duration)
+            else:
+                while True:
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            client.loop_stop()
+            client.disconnect()
+
+    print(f"Recorded {count} messages to {args.output}")
+
+
+def load_recording(path: pathlib.Path) -> list[tuple[float, str, str]]:
+    with gzip.open(path, "rt", encoding="utf-8") as recording:
+        header = json.loads(recording.readline())
+
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"{path} is not a Hummingbot recording")
+
+        return [tuple(json.loads(line)) for line in recording if line.strip()]
+
+
+def fan_out_topics(topic: str, fan_out: int) -> list[str]:
+    if fan_out <= 1:
+        return [topic]
+
+    topic_parts = topic.split("/")
+
+    if len(topic_parts) < 3:
+        return [topic]
+
+    return ["/".join([topic_parts[0], f"{topic_parts[1]}-{k}", *topic_parts[2:]]) for k in range(fan_out)]
+
+
+async def async_monitor_loop_lag(lags: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+
+    while True:
+        scheduled = loop.time()
+        await asyncio.sleep(LAG_MONITOR_INTERVAL)
+        lags.append(loop.time() - scheduled - LAG_MONITOR_INTERVAL)
+
+
+async def async_replay(records: list[tuple[float, str, str]], speed: float, fan_out: int) -> None:
+    from ha_stubs import (
+        LocalMqttBroker,
+        StubHass,
+        async_setup_integration,
+        percentile,
+        stub_home_assistant,
+    )
+
+    loop = asyncio.get_running_loop()
+    hass = StubHass(loop)
+    broker = LocalMqttBroker()
+    samples = list()
+    lags = list()
+    perf_counter_ns = time.perf_counter_ns
+
+    # Size the instance cap to the fleet being modelled so no replayed instance is rejected.
+    instance_ids = {topic.split("/")[1] for _, topic, _ in records if topic.count("/") >= 2}
+    options = {"max_instances": max(len(instance_ids) * max(fan_out, 1), 1)}
+
+    with stub_home_assistant(broker, options) as write_counter:
+        manager, pending_adds = async_setup_integration(hass, broker)
+        lag_monitor = loop.create_task(async_monitor_loop_lag(lags))
+        started = loop.time()
+
+        for offset, topic, payload in records:
+            if speed > 0:
+                if (delay := started + offset / speed - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+            else:
+                await asyncio.sleep(0)
+
+            for replay_topic in fan_out_topics(topic, fan_out):
+                t0 = perf_counter_ns()
+                broker.deliver(replay_topic, payload)
+                samples.append(perf_counter_ns() - t0)
+
+        await asyncio.gather(*pending_adds)
+        manager.state_write_scheduler.async_flush_all()
+        wall_time = loop.time() - started
+        lag_monitor.cancel()
+
+    busy_time = sum(samples) / 1e9
+    lag_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+
+    print(f"messages delivered   {len(samples)}")
+    print(f"wall time            {wall_time:.2f} s")
+    print(f"callback time        {busy_time:.3f} s ({busy_time / wall_time * 100 if wall_time else 0:.1f}% of the event loop)")
+    print(f"per message          p50 {percentile(samples, 50):.1f} us, p99 {percentile(samples, 99):.1f} us, "
+          f"max {max(samples, default=0) / 1000:.1f} us")
+    print(f"event loop lag       p99 {lag_ms[min(len(lag_ms) - 1, int(len(lag_ms) * 0.99))]:.2f} ms, max {lag_ms[-1]:.2f} ms")
+    print(f"state writes         {write_counter.writes}")
+    print(f"commands published   {broker.published}")
+
+
+def replay(args: argparse.Namespace) -> None:
+    records = load_recording(args.recording)
+    print(f"Replaying {len(records)} messages from {args.recording} at speed {args.speed or 'max'}, fan-out {args.fan_out}")
+    asyncio.run(async_replay(records, args.speed, args.fan_out))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="record live traffic from a broker")
+    record_parser.add_argument("output", type=pathlib.Path)
+    record_parser.add_argument("--host", default="localhost")
+    record_parser.add_argument("--port", type=int, default=1883)
+    record_parser.add_argument("--username")
+    record_parser.add_argument("--password")
+    record_parser.add_argument("--topic", default="hbot/#")
+    record_parser.add_argument("--duration", type=float, help="seconds to record, until interrupted if omitted")
+    record_parser.set_defaults(func=record)
+
+    replay_parser = subparsers.add_parser("replay", help="replay a recording into the integration")
+    replay_parser.add_argument("recording", type=pathlib.Path)
+    replay_parser.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier, 0 for as fast as possible")
+    replay_parser.add_argument("--fan-out", type=int, default=1, help="number of synthetic instances per recorded instance")
+    replay_parser.set_defaults(func=replay)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from homeassistant.components import mqtt
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 
-from .const import _LOGGER, DOMAIN, PLATFORMS, TOPIC
+from .const import _LOGGER, DOMAIN, PLATFORMS
 from .hummingbot_coordinator import HbotManager
 from .services import async_register_services
 
@@ -23,9 +23,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     @callback
     def async_event_received(msg: mqtt.ReceiveMessage) -> None:
-        HbotManager.instance().async_process_mqtt_data_update(hass, msg)
+        HbotManager.instance().async_route_mqtt_message(hass, msg)
 
-    entry.async_on_unload(await mqtt.async_subscribe(hass, TOPIC, async_event_received, 0))
+    await HbotManager.instance().async_restore_snapshot(hass)
+    HbotManager.instance().async_precreate_known_instances(hass, entry)
+
+    for topic in HbotManager.instance().subscription_topics:
+        entry.async_on_unload(await mqtt.async_subscribe(hass, topic, async_event_received, 0))
 
     return True
 
@@ -40,6 +44,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
     if await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        await HbotManager.instance().async_save_snapshot()
         HbotManager.unload()
         return True
     return False
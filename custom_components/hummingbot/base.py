@@ -1,7 +1,6 @@
 """Support for collecting data from Hummingbot instances."""
 from __future__ import annotations
 
-import time
 from typing import TYPE_CHECKING
 
 from homeassistant.helpers import entity
@@ -42,7 +41,7 @@ class HbotBase(entity.Entity):
         self._attr_available = False
         if unit_of_measurement:
             self._attr_native_unit_of_measurement = unit_of_measurement
-        self._hbot_entity_added = None
+        self._hbot_entity_added = False
 
     @property
     def _hbot_instance_id(self) -> str:
@@ -86,7 +85,7 @@ class HbotBase(entity.Entity):
             return
 
         self._attr_available = True
-        self.async_write_ha_state()
+        self.async_schedule_write_ha_state()
 
     def set_unavailable(self) -> None:
         if not self.check_ready():
@@ -96,28 +95,10 @@ class HbotBase(entity.Entity):
             return
 
         self._attr_available = False
-        self.async_write_ha_state()
-
-    def check_added_time(self) -> bool:
-        if self._hbot_entity_added is None:
-            self.set_added_time()
-            return False
-
-        time_now = int(time.time())
-
-        if time_now - 3 > self._hbot_entity_added:
-            return True
-
-        return False
-
-    def set_added_time(self) -> None:
-        self._hbot_entity_added = int(time.time())
+        self.async_schedule_write_ha_state()
 
     def check_ready(self) -> bool:
-        if self.entity_id not in self._hbot_instance.ent_registry.entities:
-            return False
-
-        return self.check_added_time()
+        return self._hbot_entity_added
 
     def update_attributes_with_event(self, event) -> None:
         if self._state_key in event:
@@ -125,8 +106,25 @@ class HbotBase(entity.Entity):
 
         self._attr_extra_state_attributes = event
 
+    async def async_added_to_hass(self) -> None:
+        self._hbot_entity_added = True
+        self._hbot_instance.async_entity_added(self)
+
+    def add_to_platform_abort(self) -> None:
+        super().add_to_platform_abort()
+        self._hbot_instance.async_entity_skipped(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._hbot_entity_added = False
+        self._hbot_instance.async_entity_removed(self)
+        self._hbot_instance.state_write_scheduler.async_forget(self)
+
+    def async_schedule_write_ha_state(self) -> None:
+        self._hbot_instance.state_write_scheduler.async_schedule_write(self)
+
     def async_safe_write_ha_state(self) -> None:
         if self.hass is not None:
+            self._hbot_instance.metrics.state_writes += 1
             self.async_write_ha_state()
         else:
             _LOGGER.warning(f"Unable to update state for {self}, entity has been aborted.")
@@ -3,15 +3,14 @@ from __future__ import annotations
 
 from typing import Any
 
-from homeassistant.components import mqtt
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import slugify
 
 from .base import HbotBase
-from .const import _LOGGER, TOPIC, TYPES_BINARY_SENSORS
+from .const import _LOGGER, TYPES_BINARY_SENSORS
 from .hummingbot_coordinator import HbotInstance, HbotManager
 
 
@@ -44,11 +43,7 @@ async def async_setup_entry(
     """Set up the Hummingbot binary_sensor entry."""
     _LOGGER.debug("Set up binary_sensors start.")
 
-    @callback
-    def async_binary_sensor_event_received(msg: mqtt.ReceiveMessage) -> None:
-        HbotManager.instance().async_process_entity_mqtt_discovery(hass, msg, discover_binary_sensors, async_add_entities)
-
-    entry.async_on_unload(await mqtt.async_subscribe(hass, TOPIC, async_binary_sensor_event_received, 0))
+    entry.async_on_unload(HbotManager.instance().async_register_entity_discovery(discover_binary_sensors, async_add_entities))
 
     _LOGGER.debug("Set up binary_sensors done.")
 
@@ -73,4 +68,4 @@ class HbotBinarySensor(HbotBase, BinarySensorEntity):
 
         self.update_attributes_with_event(ev)
 
-        self.async_safe_write_ha_state()
+        self.async_schedule_write_ha_state()
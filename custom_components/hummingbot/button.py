@@ -1,18 +1,21 @@
 """Support for controlling Hummingbot instances with buttons."""
 from __future__ import annotations
 
-from homeassistant.components import mqtt
+from typing import Any
+
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import slugify
 
 from .base import HbotBase
 from .const import (
     _LOGGER,
-    COMMAND_TOPIC,
-    TOPIC,
+    COMMAND_IMPORT,
+    COMMAND_START,
+    COMMAND_STATUS,
+    COMMAND_STOP,
     TYPE_ENTITY_STRATEGY_GET_STATUS,
     TYPE_ENTITY_STRATEGY_IMPORT,
     TYPE_ENTITY_STRATEGY_START,
@@ -51,11 +54,7 @@ async def async_setup_entry(
     """Set up the Hummingbot buttons entry."""
     _LOGGER.debug("Set up buttons start.")
 
-    @callback
-    def async_button_event_received(msg: mqtt.ReceiveMessage) -> None:
-        HbotManager.instance().async_process_entity_mqtt_discovery(hass, msg, discover_buttons, async_add_entities)
-
-    entry.async_on_unload(await mqtt.async_subscribe(hass, TOPIC, async_button_event_received, 0))
+    entry.async_on_unload(HbotManager.instance().async_register_entity_discovery(discover_buttons, async_add_entities))
 
     _LOGGER.debug("Set up buttons done.")
 
@@ -67,33 +66,30 @@ class HbotButton(HbotBase, ButtonEntity):
         """Initialize the button."""
         super().__init__(*args, **kwargs)
 
-        self._command_topic = self._build_cmd_topic()
+        self._command = self._build_command()
 
-    def _build_cmd_topic(self) -> str:
+    def _build_command(self) -> str:
         if self._hbot_entity_type == TYPE_ENTITY_STRATEGY_START:
-            return COMMAND_TOPIC.format(self._hbot_instance_id, "start")
+            return COMMAND_START
         elif self._hbot_entity_type == TYPE_ENTITY_STRATEGY_GET_STATUS:
-            return COMMAND_TOPIC.format(self._hbot_instance_id, "status")
+            return COMMAND_STATUS
         elif self._hbot_entity_type == TYPE_ENTITY_STRATEGY_STOP:
-            return COMMAND_TOPIC.format(self._hbot_instance_id, "stop")
+            return COMMAND_STOP
         elif self._hbot_entity_type == TYPE_ENTITY_STRATEGY_IMPORT:
-            return COMMAND_TOPIC.format(self._hbot_instance_id, "import")
+            return COMMAND_IMPORT
 
     @property
-    def _command_payload(self) -> str:
+    def _command_data(self) -> dict[str, Any] | None:
         if self._hbot_entity_type == TYPE_ENTITY_STRATEGY_IMPORT:
-            strategy_name_state = self.hass.states.get(self._hbot_instance.strategy_helper)
+            strategy_name_helper = self._hbot_instance.strategy_name_helper
+            strategy_name_state = self.hass.states.get(strategy_name_helper) if strategy_name_helper else None
             strategy_name = strategy_name_state.state if strategy_name_state is not None else ""
-            data_dict = {"strategy": strategy_name}
-            self._hbot_instance.set_last_imported_strategy(strategy_name)
-            return self._hbot_instance.get_cmd_payload("hass_replies_import", data_dict)
+            return {"strategy": strategy_name}
         else:
-            return self._hbot_instance.get_cmd_payload()
+            return None
 
     def _slug(self) -> str:
         return f"button.{slugify(self._attr_name)}"
 
     async def async_press(self) -> None:
-        await mqtt.async_publish(
-            self.hass, self._command_topic, self._command_payload, 0
-        )
+        await self._hbot_instance.async_send_command(self._command, self._command_data)
@@ -0,0 +1,71 @@
+"""Correlate Hummingbot command replies with the commands that caused them."""
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from typing import Any
+
+from .const import MAX_COMMAND_TIMEOUT
+
+
+class HbotPendingCommand:
+    __slots__ = ("correlation_id", "command", "created", "future")
+
+    def __init__(self, command: str):
+        self.correlation_id = uuid.uuid4().hex
+        self.command = command
+        self.created = time.monotonic()
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class HbotCommandTracker:
+    """Track the commands of one instance that are waiting for a reply.
+
+    Every command asks for its reply on a topic of its own ending in the
+    correlation ID, so replies are matched on that ID alone and never to
+    another command. Commands nobody collects are dropped after
+    MAX_COMMAND_TIMEOUT.
+    """
+
+    def __init__(self):
+        self._pending = dict()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def async_register(self, command: str) -> HbotPendingCommand:
+        self._async_expire(time.monotonic())
+
+        pending = HbotPendingCommand(command)
+        self._pending[pending.correlation_id] = pending
+
+        return pending
+
+    def async_discard(self, pending: HbotPendingCommand) -> None:
+        self._pending.pop(pending.correlation_id, None)
+
+    def async_resolve(self, correlation_id: str, payload: dict[str, Any]) -> HbotPendingCommand | None:
+        if (pending := self._pending.pop(correlation_id, None)) is None:
+            return None
+
+        if not pending.future.done():
+            pending.future.set_result(payload.get("data"))
+
+        return pending
+
+    def async_cancel_all(self) -> None:
+        for pending in self._pending.values():
+            pending.future.cancel()
+
+        self._pending = dict()
+
+    def _async_expire(self, time_now: float) -> None:
+        while self._pending:
+            pending = next(iter(self._pending.values()))
+
+            if time_now - pending.created < MAX_COMMAND_TIMEOUT:
+                return
+
+            del self._pending[pending.correlation_id]
+            pending.future.cancel()
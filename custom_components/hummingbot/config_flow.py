@@ -9,10 +9,23 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_INSTANCE_TTL,
+    CONF_MAX_INSTANCES,
+    CONF_MAX_ORDER_ATTRIBUTES,
+    CONF_STATE_WRITE_INTERVAL,
+    CONF_STATUS_DEADBAND,
     CONF_STATUS_UPDATE_FREQUENCY,
     CONF_STRATEGY_NAME_HELPER,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DEFAULT_INSTANCE_TTL,
+    DEFAULT_MAX_INSTANCES,
+    DEFAULT_MAX_ORDER_ATTRIBUTES,
+    DEFAULT_STATE_WRITE_INTERVAL,
+    DEFAULT_STATUS_DEADBAND,
     DEFAULT_STATUS_UPDATE_INTERVAL,
     DOMAIN,
+    STATUS_POLL_MIN_INTERVAL,
 )
 
 
@@ -67,7 +80,7 @@ class HummingbotOptionsFlowHandler(OptionsFlow):
                         description={
                             "suggested_value": self.entry.options.get(CONF_STATUS_UPDATE_FREQUENCY, DEFAULT_STATUS_UPDATE_INTERVAL)
                         },
-                    ): int,
+                    ): vol.All(int, vol.Range(min=STATUS_POLL_MIN_INTERVAL)),
                     vol.Optional(
                         CONF_STRATEGY_NAME_HELPER,
                         description={
@@ -78,6 +91,40 @@ class HummingbotOptionsFlowHandler(OptionsFlow):
                             **{state.entity_id: state.name for state in self.hass.states.async_all("input_text")},
                         }
                     ),
+                    vol.Optional(
+                        CONF_MAX_ORDER_ATTRIBUTES,
+                        description={
+                            "suggested_value": self.entry.options.get(CONF_MAX_ORDER_ATTRIBUTES, DEFAULT_MAX_ORDER_ATTRIBUTES)
+                        },
+                    ): int,
+                    vol.Optional(
+                        CONF_STATUS_DEADBAND,
+                        description={
+                            "suggested_value": self.entry.options.get(CONF_STATUS_DEADBAND, DEFAULT_STATUS_DEADBAND)
+                        },
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_STATE_WRITE_INTERVAL,
+                        description={
+                            "suggested_value": self.entry.options.get(CONF_STATE_WRITE_INTERVAL, DEFAULT_STATE_WRITE_INTERVAL)
+                        },
+                    ): int,
+                    vol.Optional(
+                        CONF_MAX_INSTANCES,
+                        description={
+                            "suggested_value": self.entry.options.get(CONF_MAX_INSTANCES, DEFAULT_MAX_INSTANCES)
+                        },
+                    ): int,
+                    vol.Optional(
+                        CONF_INSTANCE_TTL,
+                        description={
+                            "suggested_value": self.entry.options.get(CONF_INSTANCE_TTL, DEFAULT_INSTANCE_TTL)
+                        },
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_DIAGNOSTIC_SENSORS,
+                        default=self.entry.options.get(CONF_DIAGNOSTIC_SENSORS, DEFAULT_DIAGNOSTIC_SENSORS),
+                    ): bool,
                 },
             ),
             errors=errors,
@@ -7,8 +7,10 @@ _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "hummingbot"
 
-TOPIC = "hbot/#"
+ENDPOINT_TOPIC = "hbot/+/{0}"
+REPLY_ENDPOINT_TOPIC = "hbot/+/{0}/+"
 COMMAND_TOPIC = "hbot/{0}/{1}"
+REPLY_TOPIC = "hbot/{0}/{1}/{2}"
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -18,9 +20,39 @@ PLATFORMS = [
 
 CONF_STATUS_UPDATE_FREQUENCY = "status_update_frequency"
 CONF_STRATEGY_NAME_HELPER = "strategy_name_helper"
+CONF_MAX_ORDER_ATTRIBUTES = "max_order_attributes"
+CONF_STATUS_DEADBAND = "status_deadband"
+CONF_STATE_WRITE_INTERVAL = "state_write_interval"
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
+CONF_MAX_INSTANCES = "max_instances"
+CONF_INSTANCE_TTL = "instance_ttl"
 
 ATTR_INSTANCE_ID = "instance_id"
 ATTR_STRATEGY_NAME = "strategy_name"
+ATTR_DURATION = "duration"
+ATTR_TARGET_STRATEGY = "target_strategy"
+ATTR_TRADING_PAIR = "trading_pair"
+ATTR_TIMEOUT = "timeout"
+
+COMMAND_START = "start"
+COMMAND_STOP = "stop"
+COMMAND_STATUS = "status"
+COMMAND_IMPORT = "import"
+
+REPLY_ENDPOINT = "hass_replies"
+REPLY_ENDPOINT_IMPORT = "hass_replies_import"
+
+REPLY_ENDPOINTS = [
+    REPLY_ENDPOINT,
+    REPLY_ENDPOINT_IMPORT,
+]
+
+COMMAND_REPLY_ENDPOINTS = {
+    COMMAND_IMPORT: REPLY_ENDPOINT_IMPORT,
+}
+
+DEFAULT_COMMAND_TIMEOUT = 10
+MAX_COMMAND_TIMEOUT = 60
 
 TYPE_ENTITY_ACTIVE_ORDERS = "Active Orders"
 TYPE_ENTITY_STRATEGY_RUNNING = "Strategy Running"
@@ -30,6 +62,20 @@ TYPE_ENTITY_STRATEGY_STATUS = "Strategy Status"
 TYPE_ENTITY_STRATEGY_GET_STATUS = "Strategy Get Status"
 TYPE_ENTITY_STRATEGY_STOP = "Strategy Stop"
 TYPE_ENTITY_STRATEGY_IMPORT = "Strategy Import"
+TYPE_ENTITY_MARKET = "Market {0} {1}"
+TYPE_ENTITY_INGEST_METRICS = "Ingest Metrics"
+TYPE_ENTITY_REALIZED_PNL = "Realized PnL {0}"
+
+# Window length and bucket width in seconds for the rolling trade aggregates.
+TRADE_STATS_WINDOWS = {
+    "1h": (3600, 60),
+    "24h": (86400, 900),
+    "7d": (604800, 3600),
+}
+
+TYPES_TRADE_STATS_SENSORS = {
+    TYPE_ENTITY_REALIZED_PNL.format(window): window for window in TRADE_STATS_WINDOWS
+}
 
 TYPES_BINARY_SENSORS = [
     TYPE_ENTITY_STRATEGY_RUNNING,
@@ -46,14 +92,56 @@ TYPES_BUTTONS = [
 TYPES_SENSORS = [
     TYPE_ENTITY_ACTIVE_ORDERS,
     TYPE_ENTITY_STRATEGY_STATUS,
+    *TYPES_TRADE_STATS_SENSORS,
 ]
 
-TOTAL_INSTANCE_ENTITIES = 8
+# Attributes rewritten in full on every change, kept in the state machine but not in the recorder.
+UNRECORDED_ATTRIBUTES = frozenset({
+    "orders",
+    "depth",
+    "books",
+    "balances",
+    "market_prices",
+})
+
+TOTAL_INSTANCE_ENTITIES = len(TYPES_BINARY_SENSORS) + len(TYPES_BUTTONS) + len(TYPES_SENSORS)
+
+MAX_PENDING_INSTANCE_MESSAGES = 100
+
+PROFILE_FILE_PREFIX = "hummingbot_profile"
+DEFAULT_PROFILE_DURATION = 60
+MAX_PROFILE_DURATION = 3600
+DEFAULT_PROFILE_TOP_FUNCTIONS = 50
 
 DEFAULT_STATUS_UPDATE_INTERVAL = 10
 
+STATUS_POLL_MIN_INTERVAL = 5
+STATUS_POLL_BACKOFF = 1.5
+STATUS_POLL_MAX_BACKOFF = 6
+STATUS_POLL_JITTER = 0.2
+
+DEFAULT_MAX_ORDER_ATTRIBUTES = 100
+
+DEFAULT_STATUS_DEADBAND = 0.0
+
+DEFAULT_STATE_WRITE_INTERVAL = 250
+
+DEFAULT_DIAGNOSTIC_SENSORS = False
+
+INGEST_METRICS_SENSOR_UPDATE_INTERVAL = 60
+
+DEFAULT_MAX_INSTANCES = 1000
+
+MAX_REJECTED_INSTANCE_WARNINGS = 100
+
+# Removing idle instances deletes their devices and entities, 0 keeps them.
+DEFAULT_INSTANCE_TTL = 0
+
 BUY_ORDER_CREATED_TYPE = "BuyOrderCreated"
 SELL_ORDER_CREATED_TYPE = "SellOrderCreated"
+BUY_ORDER_COMPLETED_TYPE = "BuyOrderCompleted"
+SELL_ORDER_COMPLETED_TYPE = "SellOrderCompleted"
+ORDER_FILLED_TYPE = "OrderFilled"
 
 ORDER_CREATED_TYPES = [
     BUY_ORDER_CREATED_TYPE,
@@ -63,6 +151,8 @@ ORDER_CREATED_TYPES = [
 ORDER_TYPES = [
     BUY_ORDER_CREATED_TYPE,
     SELL_ORDER_CREATED_TYPE,
+    BUY_ORDER_COMPLETED_TYPE,
+    SELL_ORDER_COMPLETED_TYPE,
     "OrderCancelled"
 ]
 
@@ -75,4 +165,17 @@ VALID_ENTITY_ENDPOINTS = [
     "log",
 ]
 
+AVAILABILITY_ENDPOINTS = [
+    "status_updates",
+]
+
+HEARTBEAT_TS_FIELD = '"ts"'
+HEARTBEAT_TS_FIELD_BYTES = HEARTBEAT_TS_FIELD.encode()
+
 INSTANCE_TIMEOUT_SECONDS = 120
+
+SNAPSHOT_STORAGE_KEY = "hummingbot.snapshot"
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_INTERVAL = 60
+
+INSTANCE_ID_PATTERN = r"[A-Za-z0-9][A-Za-z0-9_.\-]{0,63}"
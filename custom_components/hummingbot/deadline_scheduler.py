@@ -0,0 +1,96 @@
+"""Deadline heap shared by the fleet-wide Hummingbot schedulers."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+
+
+class HbotDeadlineScheduler:
+    """Arm one timer for the earliest deadline of all tracked instances.
+
+    Every instance has at most one live heap entry. Moving a deadline later
+    only updates it, the entry is re-queued when it surfaces. Moving it
+    earlier pushes a new entry and leaves the old one stale.
+    """
+
+    def __init__(self):
+        self._deadlines = dict()
+        self._queued = dict()
+        self._heap = list()
+        self._timer_handle = None
+        self._timer_when = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def async_remove(self, instance_id: str) -> None:
+        self._deadlines.pop(instance_id, None)
+
+    def unload(self) -> None:
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+        self._deadlines = dict()
+        self._queued = dict()
+        self._heap = list()
+
+    def _async_expired(self, instance_ids: list[str]) -> None:
+        """Handle instances whose deadline passed, they are no longer tracked."""
+        raise NotImplementedError
+
+    def _async_set_deadline(self, instance_id: str, deadline: float, loop: asyncio.AbstractEventLoop) -> None:
+        self._deadlines[instance_id] = deadline
+
+        if (queued := self._queued.get(instance_id)) is not None and queued <= deadline:
+            return
+
+        self._queued[instance_id] = deadline
+        heapq.heappush(self._heap, (deadline, instance_id))
+        self._async_arm_timer(loop)
+
+    def _async_arm_timer(self, loop: asyncio.AbstractEventLoop) -> None:
+        if not self._heap:
+            return
+
+        when = self._heap[0][0]
+
+        if self._timer_handle is not None:
+            if self._timer_when <= when:
+                return
+
+            self._timer_handle.cancel()
+
+        self._timer_when = when
+        self._timer_handle = loop.call_at(when, self._async_fire)
+
+    def _async_fire(self) -> None:
+        self._timer_handle = None
+
+        loop = asyncio.get_running_loop()
+        time_now = loop.time()
+        expired = list()
+
+        while self._heap and self._heap[0][0] <= time_now:
+            queued, instance_id = heapq.heappop(self._heap)
+
+            if self._queued.get(instance_id) != queued:
+                continue
+
+            del self._queued[instance_id]
+
+            if (deadline := self._deadlines.get(instance_id)) is None:
+                continue
+
+            if deadline > time_now:
+                self._queued[instance_id] = deadline
+                heapq.heappush(self._heap, (deadline, instance_id))
+                continue
+
+            del self._deadlines[instance_id]
+            expired.append(instance_id)
+
+        self._async_arm_timer(loop)
+
+        if expired:
+            self._async_expired(expired)
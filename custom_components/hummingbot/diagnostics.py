@@ -0,0 +1,17 @@
+"""Diagnostics support for Hummingbot."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .hummingbot_coordinator import HbotManager
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "options": dict(entry.options),
+        "manager": HbotManager.instance().diagnostics_dict,
+    }
@@ -0,0 +1,108 @@
+"""Trade fills reported by Hummingbot instances."""
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except Exception:
+        return 0.0
+
+
+class HbotFill:
+    __slots__ = (
+        "trading_pair",
+        "base_asset",
+        "quote_asset",
+        "side",
+        "price",
+        "amount",
+        "fees",
+        "timestamp",
+    )
+
+    def __init__(
+        self,
+        trading_pair: str,
+        side: str,
+        price: float,
+        amount: float,
+        fees: dict[str, float],
+        timestamp: float,
+    ):
+        self.trading_pair = trading_pair
+        self.base_asset, self.quote_asset = trading_pair.split("-", 1)
+        self.side = side
+        self.price = price
+        self.amount = amount
+        self.fees = fees
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_event_data(cls, fill_data: dict[str, Any], timestamp: Any = None) -> HbotFill | None:
+        """Build a fill from OrderFilled event data, None if the event is unusable."""
+        trading_pair = str(fill_data.get("trading_pair", ""))
+        trade_type = str(fill_data.get("trade_type", "")).split(".")[-1].lower()
+        price = _to_float(fill_data.get("price"))
+        amount = _to_float(fill_data.get("amount"))
+
+        if "-" not in trading_pair or trade_type not in ("buy", "sell") or price <= 0 or amount <= 0:
+            return None
+
+        base_asset, quote_asset = trading_pair.split("-", 1)
+        fees = dict()
+        trade_fee = fill_data.get("trade_fee")
+
+        if isinstance(trade_fee, dict):
+            if (percent := _to_float(trade_fee.get("percent"))) > 0:
+                percent_token = trade_fee.get("percent_token") or quote_asset
+                fee_base = amount if percent_token == base_asset else amount * price
+                fees[percent_token] = percent * fee_base
+
+            for flat_fee in trade_fee.get("flat_fees") or list():
+                if isinstance(flat_fee, dict) and flat_fee.get("token"):
+                    fees[flat_fee["token"]] = fees.get(flat_fee["token"], 0.0) + _to_float(flat_fee.get("amount"))
+
+        return cls(
+            sys.intern(trading_pair),
+            sys.intern(trade_type),
+            price,
+            amount,
+            fees,
+            _to_float(timestamp if timestamp is not None else fill_data.get("timestamp")),
+        )
+
+    @property
+    def notional(self) -> float:
+        return self.price * self.amount
+
+    def fee_in(self, asset: str) -> float:
+        return self.fees.get(asset, 0.0)
+
+    @property
+    def balance_deltas(self) -> tuple[float, float, float, float]:
+        """Return the (total base, total quote, available base, available quote) change.
+
+        Funds for the filled side were locked when the order was placed, so only
+        the received asset changes the available balance.
+        """
+        base_fee = self.fee_in(self.base_asset)
+        quote_fee = self.fee_in(self.quote_asset)
+
+        if self.side == "buy":
+            return (
+                self.amount - base_fee,
+                -self.notional - quote_fee,
+                self.amount - base_fee,
+                -quote_fee,
+            )
+
+        return (
+            -self.amount - base_fee,
+            self.notional - quote_fee,
+            -base_fee,
+            self.notional - quote_fee,
+        )
@@ -3,31 +3,80 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 import time
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 from homeassistant import config_entries
 from homeassistant.components import mqtt
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.storage import Store
 from homeassistant.util.json import json_loads_object
 
+from .command_tracker import HbotCommandTracker
 from .const import (
     _LOGGER,
+    AVAILABILITY_ENDPOINTS,
     BUY_ORDER_CREATED_TYPE,
+    COMMAND_IMPORT,
+    COMMAND_REPLY_ENDPOINTS,
+    COMMAND_STATUS,
     COMMAND_TOPIC,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_INSTANCE_TTL,
+    CONF_MAX_INSTANCES,
+    CONF_MAX_ORDER_ATTRIBUTES,
+    CONF_STATE_WRITE_INTERVAL,
+    CONF_STATUS_DEADBAND,
     CONF_STATUS_UPDATE_FREQUENCY,
     CONF_STRATEGY_NAME_HELPER,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DEFAULT_INSTANCE_TTL,
+    DEFAULT_MAX_INSTANCES,
+    DEFAULT_MAX_ORDER_ATTRIBUTES,
+    DEFAULT_STATUS_DEADBAND,
     DEFAULT_STATUS_UPDATE_INTERVAL,
-    INSTANCE_TIMEOUT_SECONDS,
+    DOMAIN,
+    ENDPOINT_TOPIC,
+    HEARTBEAT_TS_FIELD,
+    HEARTBEAT_TS_FIELD_BYTES,
+    INGEST_METRICS_SENSOR_UPDATE_INTERVAL,
+    INSTANCE_ID_PATTERN,
+    MAX_PENDING_INSTANCE_MESSAGES,
+    MAX_REJECTED_INSTANCE_WARNINGS,
     ORDER_CREATED_TYPES,
+    ORDER_FILLED_TYPE,
     ORDER_TYPES,
+    REPLY_ENDPOINT,
+    REPLY_ENDPOINT_TOPIC,
+    REPLY_ENDPOINTS,
+    REPLY_TOPIC,
+    SNAPSHOT_SAVE_INTERVAL,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    STATUS_POLL_MIN_INTERVAL,
     TOTAL_INSTANCE_ENTITIES,
+    TRADE_STATS_WINDOWS,
     TYPE_ENTITY_ACTIVE_ORDERS,
+    TYPE_ENTITY_INGEST_METRICS,
+    TYPE_ENTITY_MARKET,
     TYPE_ENTITY_STRATEGY_IMPORTED,
     TYPE_ENTITY_STRATEGY_RUNNING,
     TYPE_ENTITY_STRATEGY_STATUS,
+    TYPES_TRADE_STATS_SENSORS,
     VALID_ENTITY_ENDPOINTS,
 )
+from .fills import HbotFill
+from .liveness_scheduler import HbotLivenessScheduler
+from .metrics import DROP_DECODE_ERROR, DROP_NOT_READY, HbotInstanceMetrics
+from .order_tracker import HbotOrderTracker
+from .profiler import HbotProfiler
+from .state_writer import HbotStateWriteScheduler
+from .status_parser import HbotStatus, HbotStatusOrder, parse_status
+from .status_poll_scheduler import HbotStatusPollScheduler
+from .trade_stats import HbotTradeStats, HbotTradeTotals
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -35,19 +84,47 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .base import HbotBase
     from .binary_sensor import HbotBinarySensor
     from .button import HbotButton
     from .sensor import HbotSensor
 
 
+_INSTANCE_ID_RE = re.compile(INSTANCE_ID_PATTERN)
+
+
 class InvalidHbotEvent(Exception):
     """Invalid Hummingbot Events"""
 
 
+def _value_exceeds_deadband(old_value: float, new_value: float, deadband: float) -> bool:
+    if new_value == old_value:
+        return False
+
+    if deadband <= 0 or old_value == 0:
+        return True
+
+    return abs(new_value - old_value) > abs(old_value) * deadband
+
+
 class HbotBalanceItem:
-    def __init__(self):
+    def __init__(self, deadband: float = 0.0):
         self._base = 0.0
         self._quote = 0.0
+        self._deadband = deadband
+        self._is_dirty = True
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._is_dirty
+
+    @property
+    def deadband(self) -> float:
+        return self._deadband
+
+    @deadband.setter
+    def deadband(self, value: float) -> None:
+        self._deadband = value
 
     @property
     def base(self) -> float:
@@ -56,9 +133,13 @@ class HbotBalanceItem:
     @base.setter
     def base(self, value: Any) -> None:
         try:
-            self._base = float(value)
+            value = float(value)
         except Exception:
-            pass
+            return
+
+        if _value_exceeds_deadband(self._base, value, self._deadband):
+            self._base = value
+            self._is_dirty = True
 
     @property
     def quote(self) -> float:
@@ -67,9 +148,13 @@ class HbotBalanceItem:
     @quote.setter
     def quote(self, value: Any) -> None:
         try:
-            self._quote = float(value)
+            value = float(value)
         except Exception:
-            pass
+            return
+
+        if _value_exceeds_deadband(self._quote, value, self._deadband):
+            self._quote = value
+            self._is_dirty = True
 
     @property
     def data_dict(self) -> dict[str, float]:
@@ -78,11 +163,41 @@ class HbotBalanceItem:
             "quote": self.quote,
         }
 
+    def restore(self, data: dict[str, Any]) -> None:
+        self.base = data.get("base")
+        self.quote = data.get("quote")
+
+    def add(self, base_delta: float, quote_delta: float) -> None:
+        """Apply a known change, bypassing the deadband so small deltas are not lost."""
+        if base_delta:
+            self._base += base_delta
+            self._is_dirty = True
+
+        if quote_delta:
+            self._quote += quote_delta
+            self._is_dirty = True
+
+    def clear_dirty(self) -> None:
+        self._is_dirty = False
+
 
 class HbotBalances:
-    def __init__(self):
-        self._total = HbotBalanceItem()
-        self._available = HbotBalanceItem()
+    def __init__(self, deadband: float = 0.0):
+        self._total = HbotBalanceItem(deadband)
+        self._available = HbotBalanceItem(deadband)
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._total.is_dirty or self._available.is_dirty
+
+    @property
+    def deadband(self) -> float:
+        return self._total.deadband
+
+    @deadband.setter
+    def deadband(self, value: float) -> None:
+        self._total.deadband = value
+        self._available.deadband = value
 
     @property
     def total(self) -> HbotBalanceItem:
@@ -99,12 +214,47 @@ class HbotBalances:
             "available": self.available.data_dict,
         }
 
+    @property
+    def summary_data(self) -> dict[str, float]:
+        return {
+            "total_base": self.total.base,
+            "total_quote": self.total.quote,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        self._total.restore(data.get("total", dict()))
+        self._available.restore(data.get("available", dict()))
+
+    def apply_fill(self, fill: HbotFill) -> None:
+        total_base, total_quote, available_base, available_quote = fill.balance_deltas
+
+        self._total.add(total_base, total_quote)
+        self._available.add(available_base, available_quote)
+
+    def clear_dirty(self) -> None:
+        self._total.clear_dirty()
+        self._available.clear_dirty()
+
 
 class HbotMarketPrices:
-    def __init__(self):
+    def __init__(self, deadband: float = 0.0):
         self._bid = 0.0
         self._ask = 0.0
         self._mid = 0.0
+        self._deadband = deadband
+        self._is_dirty = True
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._is_dirty
+
+    @property
+    def deadband(self) -> float:
+        return self._deadband
+
+    @deadband.setter
+    def deadband(self, value: float) -> None:
+        self._deadband = value
 
     @property
     def bid(self) -> float:
@@ -113,9 +263,13 @@ class HbotMarketPrices:
     @bid.setter
     def bid(self, value: Any) -> None:
         try:
-            self._bid = float(value)
+            value = float(value)
         except Exception:
-            pass
+            return
+
+        if _value_exceeds_deadband(self._bid, value, self._deadband):
+            self._bid = value
+            self._is_dirty = True
 
     @property
     def ask(self) -> float:
@@ -124,9 +278,13 @@ class HbotMarketPrices:
     @ask.setter
     def ask(self, value: Any) -> None:
         try:
-            self._ask = float(value)
+            value = float(value)
         except Exception:
-            pass
+            return
+
+        if _value_exceeds_deadband(self._ask, value, self._deadband):
+            self._ask = value
+            self._is_dirty = True
 
     @property
     def mid(self) -> float:
@@ -135,9 +293,13 @@ class HbotMarketPrices:
     @mid.setter
     def mid(self, value: Any) -> None:
         try:
-            self._mid = float(value)
+            value = float(value)
         except Exception:
-            pass
+            return
+
+        if _value_exceeds_deadband(self._mid, value, self._deadband):
+            self._mid = value
+            self._is_dirty = True
 
     @property
     def data_dict(self) -> dict[str, float]:
@@ -147,6 +309,126 @@ class HbotMarketPrices:
             "mid": self.mid,
         }
 
+    def restore(self, data: dict[str, Any]) -> None:
+        self.bid = data.get("bid")
+        self.ask = data.get("ask")
+        self.mid = data.get("mid")
+
+    def clear_dirty(self) -> None:
+        self._is_dirty = False
+
+
+class HbotMarket:
+    def __init__(self, connector: str, trading_pair: str, deadband: float = 0.0):
+        self._connector = connector
+        self._trading_pair = trading_pair
+        self._entity_type = TYPE_ENTITY_MARKET.format(connector, trading_pair)
+        self._balances = HbotBalances(deadband)
+        self._market_prices = HbotMarketPrices(deadband)
+
+    @property
+    def connector(self) -> str:
+        return self._connector
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def entity_type(self) -> str:
+        return self._entity_type
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._balances.is_dirty or self._market_prices.is_dirty
+
+    @property
+    def balances(self) -> HbotBalances:
+        return self._balances
+
+    @property
+    def market_prices(self) -> HbotMarketPrices:
+        return self._market_prices
+
+    @property
+    def data_dict(self) -> dict[str, Any]:
+        return {
+            "connector": self.connector,
+            "trading_pair": self.trading_pair,
+            "balances": self.balances.data_dict,
+            "market_prices": self.market_prices.data_dict,
+        }
+
+    def set_deadband(self, deadband: float) -> None:
+        self._balances.deadband = deadband
+        self._market_prices.deadband = deadband
+
+    def reset(self, with_balances: bool = True) -> None:
+        if with_balances:
+            self._balances = HbotBalances(self._balances.deadband)
+
+        self._market_prices = HbotMarketPrices(self._market_prices.deadband)
+
+    def clear_dirty(self) -> None:
+        self._balances.clear_dirty()
+        self._market_prices.clear_dirty()
+
+
+class HbotMarketStore:
+    def __init__(self, deadband: float = 0.0):
+        self._deadband = deadband
+        self._markets = dict()
+        self._markets_by_entity_type = dict()
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    @property
+    def markets(self) -> list[HbotMarket]:
+        return list(self._markets.values())
+
+    def get(self, connector: str, trading_pair: str) -> HbotMarket | None:
+        return self._markets.get((connector, trading_pair))
+
+    def get_by_entity_type(self, entity_type: str) -> HbotMarket | None:
+        return self._markets_by_entity_type.get(entity_type)
+
+    def get_by_trading_pair(self, trading_pair: str) -> list[HbotMarket]:
+        return [market for market in self._markets.values() if market.trading_pair == trading_pair]
+
+    def get_or_create(self, connector: str, trading_pair: str) -> tuple[HbotMarket, bool]:
+        if (market := self._markets.get((connector, trading_pair))) is not None:
+            return market, False
+
+        market = HbotMarket(connector, trading_pair, self._deadband)
+        self._markets[(connector, trading_pair)] = market
+        self._markets_by_entity_type[market.entity_type] = market
+
+        return market, True
+
+    def set_deadband(self, deadband: float) -> None:
+        self._deadband = deadband
+
+        for market in self._markets.values():
+            market.set_deadband(deadband)
+
+    def reset(self, with_balances: bool = True) -> None:
+        for market in self._markets.values():
+            market.reset(with_balances)
+
+    @property
+    def snapshot_data(self) -> list[dict[str, Any]]:
+        return [market.data_dict for market in self._markets.values()]
+
+    def restore(self, data: list[dict[str, Any]]) -> None:
+        for market_data in data:
+            if not market_data.get("connector") or not market_data.get("trading_pair"):
+                continue
+
+            market, _ = self.get_or_create(market_data["connector"], market_data["trading_pair"])
+            market.balances.restore(market_data.get("balances", dict()))
+            market.market_prices.restore(market_data.get("market_prices", dict()))
+
 
 class HbotInstance:
     def __init__(
@@ -160,63 +442,68 @@ class HbotInstance:
         self._entities_binary_sensor = list()
         self._entities_button = list()
         self._entities_sensor = list()
-        self._order_tracker = dict()
+        self._order_tracker = HbotOrderTracker()
+        self._command_tracker = HbotCommandTracker()
+        self._trade_stats = HbotTradeStats(TRADE_STATS_WINDOWS)
         self._binary_sensor_data = dict()
         self._button_data = dict()
         self._base_asset = None
         self._quote_asset = None
-        self._balances = HbotBalances()
-        self._market_prices = HbotMarketPrices()
-        self._last_status_update_interval = 0
-        self._cmd_topic_import = COMMAND_TOPIC.format(self._instance_id, "import")
+        self._balances = HbotBalances(self.status_deadband)
+        self._market_prices = HbotMarketPrices(self.status_deadband)
+        self._market_store = HbotMarketStore(self.status_deadband)
+        self._last_status_sensor_key = None
         self._cmd_topic_status = COMMAND_TOPIC.format(self._instance_id, "status")
         self._strategy_is_imported = None
         self._strategy_is_running = None
         self._ent_registry = er.async_get(self._hass)
         self._is_available = None
+        self._restored = False
+        self._restored_order_ids = set()
         self._last_event_received = None
-        self._health_check_task = None
         self._ready_for_updates = False
+        self._added_entities = set()
+        self._skipped_entities = set()
+        self._pending_messages = deque(maxlen=MAX_PENDING_INSTANCE_MESSAGES)
         self._last_changed_running = 0
+        self._metrics = HbotInstanceMetrics()
+        self._last_metrics_sensor_update = 0.0
 
     @property
-    def ready_for_updates(self):
-        if self._ready_for_updates:
-            return True
-
-        all_entities = list([ent for _, ent in self._all_entities.items()])
+    def ready_for_updates(self) -> bool:
+        return self._ready_for_updates
 
-        if not len(all_entities) >= TOTAL_INSTANCE_ENTITIES:
-            return False
+    @property
+    def status_update_frequency(self) -> int:
+        return self._manager.status_update_frequency
 
-        for entity in all_entities:
-            if not entity.check_ready():
-                return False
+    @property
+    def max_order_attributes(self) -> int:
+        return self._manager.max_order_attributes
 
-        self._ready_for_updates = True
+    @property
+    def state_write_scheduler(self) -> HbotStateWriteScheduler:
+        return self._manager.state_write_scheduler
 
-        return True
+    @property
+    def diagnostic_sensors(self) -> bool:
+        return self._manager.diagnostic_sensors
 
     @property
-    def status_update_frequency(self) -> int:
-        return self._manager.status_update_frequency
+    def metrics(self) -> HbotInstanceMetrics:
+        return self._metrics
 
     @property
     def ent_registry(self) -> er.EntityRegistry:
         return self._ent_registry
 
     @property
-    def should_update_status(self) -> bool:
-        time_now = int(time.time())
-        should_update = (
-            (time_now - self.status_update_frequency > self._last_status_update_interval) or
-            ((time_now - 5 > self._last_status_update_interval) and
-             self._market_prices.mid == 0)
-        )
-        if should_update:
-            self._last_status_update_interval = time_now
+    def market_store(self) -> HbotMarketStore:
+        return self._market_store
 
-        return should_update
+    @property
+    def order_tracker(self) -> HbotOrderTracker:
+        return self._order_tracker
 
     @property
     def balances(self) -> HbotBalances:
@@ -230,88 +517,421 @@ class HbotInstance:
     def strategy_name_helper(self) -> str:
         return self._manager.strategy_name_helper
 
+    @property
+    def status_deadband(self) -> float:
+        return self._manager.status_deadband
+
     @property
     def instance_id(self) -> str:
         return self._instance_id
 
-    def extract_event_payload(self, endpoint: str, payload: str) -> dict[str, Any]:
-        event = json_loads_object(payload)
+    @property
+    def hass(self) -> HomeAssistant:
+        return self._hass
 
-        self.check_availability(endpoint, event)
+    @property
+    def strategy_name(self) -> str | None:
+        return self._last_imported_strategy
+
+    @property
+    def primary_trading_pair(self) -> str | None:
+        """Pair of the status base and quote assets, else the only pair with orders."""
+        if self._base_asset is not None and self._quote_asset is not None:
+            return f"{self._base_asset}-{self._quote_asset}"
+
+        if len(trading_pairs := self._order_tracker.trading_pairs) == 1:
+            return trading_pairs[0]
+
+        return None
+
+    @property
+    def mid_prices(self) -> dict[str, float]:
+        mid_prices = {
+            market.trading_pair: market.market_prices.mid for market in self._market_store.markets if market.market_prices.mid
+        }
 
-        self.check_status_command()
+        if (trading_pair := self.primary_trading_pair) is not None and self.market_prices.mid:
+            mid_prices[trading_pair] = self.market_prices.mid
 
-        if endpoint not in VALID_ENTITY_ENDPOINTS:
+        return mid_prices
+
+    @property
+    def trading_pairs(self) -> set[str]:
+        trading_pairs = {market.trading_pair for market in self._market_store.markets}
+
+        if self._base_asset is not None and self._quote_asset is not None:
+            trading_pairs.add(f"{self._base_asset}-{self._quote_asset}")
+
+        return trading_pairs
+
+    def extract_event_payload(
+        self, endpoint: str, payload: str | bytes, correlation_id: str | None = None
+    ) -> dict[str, Any] | None:
+        if endpoint not in VALID_ENTITY_ENDPOINTS and endpoint not in AVAILABILITY_ENDPOINTS:
             raise InvalidHbotEvent("Invalid Endpoint")
 
+        if not self.ready_for_updates:
+            if len(self._pending_messages) == self._pending_messages.maxlen:
+                dropped_endpoint, _, _ = self._pending_messages[0]
+                self._metrics.endpoint(dropped_endpoint).dropped[DROP_NOT_READY] += 1
+
+            self._pending_messages.append((endpoint, payload, correlation_id))
+            return None
+
+        if endpoint == "hb":
+            self.check_heartbeat(payload)
+            return None
+
+        decode_start = time.perf_counter()
+
+        try:
+            event = json_loads_object(payload)
+        except ValueError:
+            self._metrics.endpoint(endpoint).dropped[DROP_DECODE_ERROR] += 1
+            raise InvalidHbotEvent("Invalid Payload")
+
+        self._metrics.endpoint(endpoint).decode_time.observe(time.perf_counter() - decode_start)
+
+        self.check_availability(endpoint, event)
+
         return event
 
+    def async_entity_added(self, entity: HbotBase) -> None:
+        if (market := self._market_store.get_by_entity_type(entity._hbot_entity_type)) is not None:
+            self.update_market_sensor_data(market)
+            return
+
+        if entity._hbot_entity_type in TYPES_TRADE_STATS_SENSORS:
+            self.update_trade_stats_sensors_data()
+
+        if entity._hbot_entity_type == TYPE_ENTITY_INGEST_METRICS:
+            self.update_ingest_metrics_sensor_data(True)
+            return
+
+        self._added_entities.add(entity._hbot_entity_type)
+        self._skipped_entities.discard(entity._hbot_entity_type)
+
+        self.async_check_ready_for_updates()
+
+    def async_entity_skipped(self, entity: HbotBase) -> None:
+        """Stop waiting for an entity Home Assistant will not add, a disabled one for instance."""
+        if self._market_store.get_by_entity_type(entity._hbot_entity_type) is not None:
+            return
+
+        if entity._hbot_entity_type == TYPE_ENTITY_INGEST_METRICS:
+            return
+
+        self._skipped_entities.add(entity._hbot_entity_type)
+
+        self.async_check_ready_for_updates()
+
+    def async_entity_removed(self, entity: HbotBase) -> None:
+        # The instance stays ready, the removed entity alone stops taking updates.
+        self._added_entities.discard(entity._hbot_entity_type)
+
+    def async_check_ready_for_updates(self) -> None:
+        if self._ready_for_updates or len(self._added_entities | self._skipped_entities) < TOTAL_INSTANCE_ENTITIES:
+            return
+
+        self._ready_for_updates = True
+
+        if self._restored:
+            self.async_push_restored_state()
+
+        self.async_replay_pending_messages()
+
+    @property
+    def snapshot_data(self) -> dict[str, Any]:
+        return {
+            "strategy": self._last_imported_strategy,
+            "running": self._strategy_is_running,
+            "imported": self._strategy_is_imported,
+            "available": self._is_available,
+            "last_event": self._last_event_received,
+            "base": self._base_asset,
+            "quote": self._quote_asset,
+            "balances": self.balances.data_dict,
+            "prices": self.market_prices.data_dict,
+            "markets": self._market_store.snapshot_data,
+            "orders": self._order_tracker.orders_data(),
+            "trade_stats": self._trade_stats.snapshot_data,
+        }
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Load state saved before a restart, the next status poll reconciles it.
+
+        Restored orders stay until the first status reply with an orders
+        table, see reconcile_restored_orders.
+        """
+        self._last_imported_strategy = data.get("strategy")
+        self._strategy_is_running = data.get("running")
+        self._strategy_is_imported = data.get("imported")
+        self._is_available = data.get("available")
+        self._last_event_received = data.get("last_event")
+        self._base_asset = data.get("base")
+        self._quote_asset = data.get("quote")
+        self.balances.restore(data.get("balances", dict()))
+        self.market_prices.restore(data.get("prices", dict()))
+        self._market_store.restore(data.get("markets", list()))
+
+        try:
+            self._trade_stats.restore(data.get("trade_stats", dict()))
+        except (TypeError, ValueError):
+            self._trade_stats = HbotTradeStats(TRADE_STATS_WINDOWS)
+
+        for order_id, order_data in data.get("orders", dict()).items():
+            try:
+                self._order_tracker.restore(order_id, order_data)
+            except (KeyError, TypeError):
+                continue
+
+            self._restored_order_ids.add(order_id)
+
+        self._restored = True
+
+        # Go unavailable on the usual timeout if the bot did not survive the restart.
+        self._manager.liveness_scheduler.async_touch(self._instance_id)
+
+        if self._strategy_is_running:
+            self._manager.status_poll_scheduler.async_add(self._instance_id)
+
+    def async_push_restored_state(self) -> None:
+        self._restored = False
+
+        for sensor_type, state in (
+            (TYPE_ENTITY_STRATEGY_RUNNING, self._strategy_is_running),
+            (TYPE_ENTITY_STRATEGY_IMPORTED, self._strategy_is_imported),
+        ):
+            if (entity := self.get_binary_sensor(sensor_type)) is not None and state is not None:
+                entity.set_event({"_state": state})
+
+        self.update_status_sensor_data()
+        self.update_active_order_sensor_data()
+        self.update_market_sensors_data()
+        self.check_trade_stats_expiry()
+        self.update_trade_stats_sensors_data()
+
+        if self._is_available:
+            for entity in self._all_entities.values():
+                entity.set_available()
+
+    def async_replay_pending_messages(self) -> None:
+        pending_messages = self._pending_messages
+        self._pending_messages = deque(maxlen=MAX_PENDING_INSTANCE_MESSAGES)
+
+        _LOGGER.debug(f"Instance {self._instance_id} ready, replaying {len(pending_messages)} messages.")
+
+        for endpoint, payload, correlation_id in pending_messages:
+            try:
+                event = self.extract_event_payload(endpoint, payload)
+            except InvalidHbotEvent:
+                continue
+
+            if event is None or endpoint not in VALID_ENTITY_ENDPOINTS:
+                continue
+
+            self.process_event(endpoint, event, correlation_id)
+
+    def process_event(self, endpoint: str, event: dict[str, Any], correlation_id: str | None = None) -> None:
+        update_start = time.perf_counter()
+
+        if correlation_id is not None:
+            self._command_tracker.async_resolve(correlation_id, event)
+
+        self.update_data(endpoint, event)
+
+        self._metrics.endpoint(endpoint).update_time.observe(time.perf_counter() - update_start)
+
+    def update_ingest_metrics_sensor_data(self, force: bool = False) -> None:
+        entity = self.get_sensor(TYPE_ENTITY_INGEST_METRICS)
+
+        if entity is None:
+            return
+
+        if not entity.check_ready():
+            return
+
+        time_now = time.monotonic()
+
+        if not force and time_now - self._last_metrics_sensor_update < INGEST_METRICS_SENSOR_UPDATE_INTERVAL:
+            return
+
+        self._last_metrics_sensor_update = time_now
+
+        entity_update_data = {
+            "_state": self._metrics.received,
+            "dropped": self._metrics.dropped,
+            **self._metrics.summary_dict,
+        }
+
+        entity.set_event(entity_update_data)
+
     def unload(self) -> None:
-        if self._health_check_task and not self._health_check_task.done():
-            self._health_check_task.cancel()
+        self._manager.liveness_scheduler.async_remove(self._instance_id)
+        self._manager.eviction_scheduler.async_remove(self._instance_id)
+        self._manager.status_poll_scheduler.async_remove(self._instance_id)
+        self._pending_messages.clear()
+        self._command_tracker.async_cancel_all()
+
+        for entity in self._all_entities.values():
+            self.state_write_scheduler.async_forget(entity)
+
+    def async_remove_entities(self) -> None:
+        for entity in self._all_entities.values():
+            if entity.registry_entry is not None:
+                self._ent_registry.async_remove(entity.entity_id)
+
+            elif entity.check_ready():
+                self._hass.async_create_task(entity.async_remove(force_remove=True))
+
+        self._all_entities = dict()
+        self._entities_binary_sensor = list()
+        self._entities_button = list()
+        self._entities_sensor = list()
+
+        device_registry = dr.async_get(self._hass)
+
+        if (device := device_registry.async_get_device(identifiers={(DOMAIN, self._instance_id)})) is not None:
+            device_registry.async_remove_device(device.id)
 
     def async_update_last_received(self) -> None:
         self._last_event_received = int(time.time())
-        self._async_start_health_check_task()
+        self._manager.liveness_scheduler.async_touch(self._instance_id)
+        self._manager.eviction_scheduler.async_touch(self._instance_id)
 
-    async def _async_health_check(self) -> None:
-        while True:
-            await asyncio.sleep(10)
+    def async_handle_timeout(self) -> None:
+        self.update_strategy_running_state(False)
+        self.set_unavailable()
 
-            if not self._last_event_received or int(time.time()) - INSTANCE_TIMEOUT_SECONDS > self._last_event_received:
-                self.update_strategy_running_state(False)
-                self.set_unavailable()
-                break
-
-    def _async_start_health_check_task(self) -> None:
-        if self._health_check_task is None or self._health_check_task.done():
-            self._health_check_task = self._hass.async_create_task(
-                self._async_health_check()
-            )
+    @property
+    def diagnostics_dict(self) -> dict[str, Any]:
+        return {
+            "ready_for_updates": self._ready_for_updates,
+            "available": self._is_available,
+            "strategy_running": self._strategy_is_running,
+            "strategy_imported": self._strategy_is_imported,
+            "last_event_received": self._last_event_received,
+            "pending_messages": len(self._pending_messages),
+            "pending_commands": len(self._command_tracker),
+            "status_poll_interval": self._manager.status_poll_scheduler.get_interval(self._instance_id),
+            "entities": len(self._all_entities),
+            "tracked_orders": len(self._order_tracker),
+            "order_tracker_memory_usage": self._order_tracker.memory_usage,
+            "markets": len(self._market_store),
+            "metrics": self._metrics.data_dict,
+        }
 
     def get_cmd_payload(
         self,
-        reply_endpoint: str = "hass_replies",
-        data: dict[str, Any] = dict()
+        reply_endpoint: str = REPLY_ENDPOINT,
+        data: dict[str, Any] = dict(),
+        correlation_id: str | None = None,
     ) -> str:
+        if correlation_id is not None:
+            reply_to = REPLY_TOPIC.format(self._instance_id, reply_endpoint, correlation_id)
+        else:
+            reply_to = COMMAND_TOPIC.format(self._instance_id, reply_endpoint)
+
+        header = {
+            "reply_to": reply_to
+        }
+
         return json.dumps({
             "timestamp": int(time.time() * 1e3),
-            "header": {
-                "reply_to": COMMAND_TOPIC.format(self._instance_id, reply_endpoint)
-            },
+            "header": header,
             "data": data,
         })
 
+    def set_status_deadband(self, deadband: float) -> None:
+        self.balances.deadband = deadband
+        self.market_prices.deadband = deadband
+        self._market_store.set_deadband(deadband)
+
     def set_last_imported_strategy(self, strategy_name: str) -> None:
         self._last_imported_strategy = strategy_name
+        self._manager.async_schedule_snapshot_save()
 
     def _publish_mqtt(self, topic: str, payload: str) -> None:
         mqtt.publish(self._hass, topic, payload, 0)
 
-    def send_status_command(self) -> None:
-        self._publish_mqtt(self._cmd_topic_status, self.get_cmd_payload())
+    async def async_send_command(
+        self, command: str, data: dict[str, Any] | None = None, timeout: float | None = None
+    ) -> Any:
+        """Publish a command, with a timeout wait for and return the reply data.
+
+        Raises asyncio.TimeoutError when no reply arrives within the timeout.
+        """
+        if command == COMMAND_IMPORT:
+            self.set_last_imported_strategy((data or dict()).get("strategy"))
+
+        reply_endpoint = COMMAND_REPLY_ENDPOINTS.get(command, REPLY_ENDPOINT)
+        pending = self._command_tracker.async_register(command)
+        payload = self.get_cmd_payload(reply_endpoint, data or dict(), pending.correlation_id)
+
+        try:
+            await mqtt.async_publish(self._hass, COMMAND_TOPIC.format(self._instance_id, command), payload, 0)
+        except Exception:
+            self._command_tracker.async_discard(pending)
+            raise
+
+        if timeout is None:
+            return None
 
-    def send_import_command(self, strategy_name: str) -> None:
-        self.set_last_imported_strategy(strategy_name)
-        data_dict = {"strategy": strategy_name}
-        self._publish_mqtt(self._cmd_topic_import, self.get_cmd_payload("hass_replies_import", data_dict))
+        # A late reply still resolves the pending command, it must not be matched to the next one.
+        return await asyncio.wait_for(asyncio.shield(pending.future), timeout)
 
-    def check_status_command(self) -> None:
-        if self._strategy_is_running and self.should_update_status:
+    def send_status_command(self) -> None:
+        pending = self._command_tracker.async_register(COMMAND_STATUS)
+        self._publish_mqtt(self._cmd_topic_status, self.get_cmd_payload(correlation_id=pending.correlation_id))
+
+    def async_poll_status(self) -> None:
+        if self._strategy_is_running:
             self.send_status_command()
 
     def reset_strategy_status(self, with_balances: bool = True) -> None:
         if with_balances:
-            self._balances = HbotBalances()
+            self._balances = HbotBalances(self.status_deadband)
 
-        self._market_prices = HbotMarketPrices()
+        self._market_prices = HbotMarketPrices(self.status_deadband)
+        self._market_store.reset(with_balances)
 
         self.update_status_sensor_data()
+        self.update_market_sensors_data()
 
     def reset_order_tracker(self) -> None:
-        self._order_tracker = dict()
+        self._order_tracker.clear()
+        self._restored_order_ids = set()
+        self._manager.async_schedule_snapshot_save()
         self.update_active_order_sensor_data()
 
+    def reconcile_restored_orders(self, status_orders: list[HbotStatusOrder]) -> None:
+        """Keep the restored orders the status still lists and drop the rest.
+
+        Hummingbot does not repeat the creation events of orders that outlive
+        a restart, so the orders table of the first status reply is the only
+        check. It has no order IDs, orders are matched on side and price, and
+        on trading pair where the table shows one.
+        """
+        restored_order_ids = self._restored_order_ids
+        self._restored_order_ids = set()
+        dropped = 0
+
+        for order_id in restored_order_ids:
+            if (order := self._order_tracker.get(order_id)) is None:
+                continue
+
+            if any(status_order.matches(order.trading_pair, order.order_side, order.price) for status_order in status_orders):
+                continue
+
+            self._order_tracker.remove(order_id)
+            dropped += 1
+
+        _LOGGER.debug(f"Instance {self._instance_id} status checked, dropped {dropped} of {len(restored_order_ids)} restored orders.")
+
+        if dropped:
+            self._manager.async_schedule_snapshot_save()
+            self.update_active_order_sensor_data()
+
     def reset_instance_on_stop(self) -> None:
         _LOGGER.debug("Received stop, resetting.")
         self.reset_strategy_status(False)
@@ -342,11 +962,20 @@ class HbotInstance:
         if not entity.check_ready():
             return
 
-        entity_update_data = {
+        # Order events only mark the sensor for a write, the attributes are built when it happens.
+        entity.set_event_builder(self.build_active_orders_data)
+
+    def build_active_orders_data(self) -> dict[str, Any]:
+        trading_pair = self.primary_trading_pair
+        mid_prices = self.mid_prices
+
+        return {
             "_state": len(self._order_tracker),
-            "orders": self.get_orders_data(),
+            **self._order_tracker.summary_data(trading_pair, mid_prices.get(trading_pair)),
+            "depth": self._order_tracker.depth_data(trading_pair, self.max_order_attributes),
+            "books": self._order_tracker.books_data(mid_prices),
+            "orders": self._order_tracker.orders_data(self.max_order_attributes, mid_prices),
         }
-        entity.set_event(entity_update_data)
 
     def update_status_sensor_data(self) -> None:
         entity = self.get_sensor(TYPE_ENTITY_STRATEGY_STATUS)
@@ -357,12 +986,32 @@ class HbotInstance:
         if not entity.check_ready():
             return
 
+        status_sensor_key = (
+            self._base_asset,
+            self._quote_asset,
+            self.strategy_name_helper,
+            self._last_imported_strategy,
+        )
+
+        if (
+            status_sensor_key == self._last_status_sensor_key and
+            not self.balances.is_dirty and
+            not self.market_prices.is_dirty
+        ):
+            return
+
+        self._last_status_sensor_key = status_sensor_key
+        self.balances.clear_dirty()
+        self.market_prices.clear_dirty()
+
         entity_update_data = {
             "_state": f"{self._base_asset}-{self._quote_asset}",
             "asset_base": self._base_asset,
             "asset_quote": self._quote_asset,
             "balances": self.balances.data_dict,
             "market_prices": self.market_prices.data_dict,
+            **self.balances.summary_data,
+            "mid_price": self.market_prices.mid,
             "strategy_name_helper": self.strategy_name_helper,
             "instance_id": self._instance_id,
             "last_imported_strategy": self._last_imported_strategy,
@@ -370,6 +1019,61 @@ class HbotInstance:
 
         entity.set_event(entity_update_data)
 
+    def update_market_sensor_data(self, market: HbotMarket) -> None:
+        entity = self.get_sensor(market.entity_type)
+
+        if entity is None:
+            return
+
+        if not entity.check_ready():
+            return
+
+        market.clear_dirty()
+
+        entity_update_data = {
+            "_state": market.market_prices.mid,
+            **market.data_dict,
+            **market.balances.summary_data,
+            "instance_id": self._instance_id,
+        }
+
+        entity.set_event(entity_update_data)
+
+    def update_trade_stats_sensors_data(self) -> None:
+        for sensor_type, window_name in TYPES_TRADE_STATS_SENSORS.items():
+            entity = self.get_sensor(sensor_type)
+
+            if entity is None or not entity.check_ready():
+                continue
+
+            totals_by_quote_asset = self._trade_stats.totals(window_name)
+
+            # The state stays in one quote asset, the instance's when it has fills in it.
+            if (quote_asset := self._quote_asset) not in totals_by_quote_asset:
+                quote_asset = next(iter(totals_by_quote_asset), self._quote_asset)
+
+            totals = totals_by_quote_asset.pop(quote_asset, None) or HbotTradeTotals()
+
+            entity_update_data = {
+                "_state": round(totals.realized_pnl, 8),
+                **totals.data_dict,
+                "window": window_name,
+                "quote_asset": quote_asset,
+                "other_quote_assets": {asset: other.data_dict for asset, other in totals_by_quote_asset.items()},
+                "instance_id": self._instance_id,
+            }
+
+            entity.set_event(entity_update_data)
+
+    def check_trade_stats_expiry(self) -> None:
+        if self._trade_stats.advance(time.time()):
+            self.update_trade_stats_sensors_data()
+
+    def update_market_sensors_data(self) -> None:
+        for market in self._market_store.markets:
+            if market.is_dirty:
+                self.update_market_sensor_data(market)
+
     def get_sensor(self, sensor_type: str) -> HbotSensor:
         return self._all_entities.get(sensor_type)
 
@@ -397,6 +1101,7 @@ class HbotInstance:
     def set_available(self) -> None:
         if not self._is_available:
             self.reset_instance_on_connected()
+            self._manager.async_schedule_snapshot_save()
 
         self._is_available = True
 
@@ -404,23 +1109,25 @@ class HbotInstance:
             s.set_available()
 
     def set_unavailable(self) -> None:
+        if self._is_available:
+            self._manager.async_schedule_snapshot_save()
+
         self._is_available = False
 
         for i, s in self._all_entities.items():
             s.set_unavailable()
 
-    def get_orders_data(self) -> dict[str, Any]:
-        orders_list = dict()
-        for oid, o in self._order_tracker.items():
-            orders_list[oid] = {
-                "t": o["type"].split(".")[1],
-                "tp": o["trading_pair"],
-                "a": o["amount"],
-                "p": o["price"],
-                "s": o["order_side"],
-                "ts": o["creation_timestamp"],
-            }
-        return orders_list
+    def add_tracked_order(self, order_id: str, order_side: str, order_data: dict[str, Any]) -> None:
+        self._order_tracker.add(order_id, order_side, order_data)
+        self._manager.async_schedule_snapshot_save()
+
+    def remove_tracked_order(self, order_id: str) -> None:
+        self._order_tracker.remove(order_id)
+        self._manager.async_schedule_snapshot_save()
+
+    def fill_tracked_order(self, order_id: str, amount: float) -> None:
+        self._order_tracker.fill(order_id, amount)
+        self._manager.async_schedule_snapshot_save()
 
     def update_strategy_running_state(self, new_state: bool) -> None:
         if int(time.time() * 1e3) - self._last_changed_running <= 400:
@@ -439,11 +1146,14 @@ class HbotInstance:
 
         self._strategy_is_running = new_state
         self._last_changed_running = int(time.time() * 1e3)
+        self._manager.async_schedule_snapshot_save()
 
         if not new_state:
+            self._manager.status_poll_scheduler.async_remove(self._instance_id)
             self.reset_instance_on_stop()
 
         else:
+            self._manager.status_poll_scheduler.async_add(self._instance_id)
             self.reset_instance_on_start()
 
         entity.set_event({"_state": self._strategy_is_running})
@@ -461,6 +1171,7 @@ class HbotInstance:
             return
 
         self._strategy_is_imported = new_state
+        self._manager.async_schedule_snapshot_save()
 
         entity.set_event({"_state": self._strategy_is_imported})
 
@@ -470,24 +1181,37 @@ class HbotInstance:
             return
 
         if endpoint == "events":
-            if payload.get("type") in ORDER_TYPES:
-                known_orders = self._order_tracker.keys()
+            if payload.get("type") == ORDER_FILLED_TYPE:
+                if (fill := HbotFill.from_event_data(payload.get("data", {}), payload.get("timestamp"))) is not None:
+                    self.apply_fill(fill)
+                    self._trade_stats.add_fill(fill, time.time())
+                    self._manager.async_schedule_snapshot_save()
+                    self.update_trade_stats_sensors_data()
+
+                    if (order_id := payload["data"].get("order_id")) in self._order_tracker:
+                        self._restored_order_ids.discard(order_id)
+                        self.fill_tracked_order(order_id, fill.amount)
+
+                        self.update_active_order_sensor_data()
+
+            elif payload.get("type") in ORDER_TYPES:
                 order_type = payload.get("type")
                 order_id = payload["data"]["order_id"]
-                if order_type in ORDER_CREATED_TYPES and order_id not in known_orders:
+                self._restored_order_ids.discard(order_id)
+
+                if order_type in ORDER_CREATED_TYPES and order_id not in self._order_tracker:
                     order_side = "buy" if order_type == BUY_ORDER_CREATED_TYPE else "sell"
-                    self._order_tracker[order_id] = {
-                        **payload["data"],
-                        "order_side": order_side
-                    }
+                    self.add_tracked_order(order_id, order_side, payload["data"])
 
                     self.update_strategy_imported_state(True)
                     self.update_strategy_running_state(True)
 
-                elif order_type not in ORDER_CREATED_TYPES and order_id in known_orders:
-                    del self._order_tracker[order_id]
+                    self.update_active_order_sensor_data()
+
+                elif order_type not in ORDER_CREATED_TYPES and order_id in self._order_tracker:
+                    self.remove_tracked_order(order_id)
 
-                self.update_active_order_sensor_data()
+                    self.update_active_order_sensor_data()
 
         elif endpoint == "notify":
             if 'strategy started' in payload.get("msg", ""):
@@ -506,29 +1230,7 @@ class HbotInstance:
                 self.update_strategy_imported_state(False)
 
             elif 'Total Balance' in payload.get("msg", ""):
-                status_lines = [line.strip().split() for line in payload.get("msg", "").split("\n") if len(line)]
-                for i, cols in enumerate(status_lines):
-
-                    if cols[0] == "Assets:":
-                        self._base_asset = status_lines[i + 1][0]
-                        self._quote_asset = status_lines[i + 1][1]
-
-                    if len(cols) < 2:
-                        continue
-
-                    if cols[0] == "Total":
-                        self.balances.total.base = cols[2]
-                        self.balances.total.quote = cols[3]
-
-                    elif cols[0] == "Available":
-                        self.balances.available.base = cols[2]
-                        self.balances.available.quote = cols[3]
-
-                    elif cols[0] == "Exchange" and self._strategy_is_running:
-                        cols = status_lines[i + 1]
-                        self.market_prices.bid = cols[2]
-                        self.market_prices.ask = cols[3]
-                        self.market_prices.mid = cols[4]
+                self.update_status_data(parse_status(payload.get("msg", "")))
 
         elif endpoint == "log":
             if 'start command initiated.' == payload.get("msg", ""):
@@ -550,11 +1252,104 @@ class HbotInstance:
 
         self.update_status_sensor_data()
 
+    def apply_fill(self, fill: HbotFill) -> None:
+        """Update balances from a fill until the next status reconciles them.
+
+        A pair traded on several connectors is left to the status, fill events
+        do not say which connector they came from.
+        """
+        if fill.base_asset == self._base_asset and fill.quote_asset == self._quote_asset:
+            self.balances.apply_fill(fill)
+
+        markets = self._market_store.get_by_trading_pair(fill.trading_pair)
+
+        if len(markets) == 1:
+            markets[0].balances.apply_fill(fill)
+            self.update_market_sensor_data(markets[0])
+
+    def update_status_data(self, status: HbotStatus) -> None:
+        if status.base_asset is not None:
+            self._base_asset = status.base_asset
+            self._quote_asset = status.quote_asset
+
+        market = status.primary_market
+        connector = market.connector if market is not None else None
+
+        if (balance := status.get_balance(self._base_asset, connector)) is not None:
+            self.balances.total.base = balance.total
+            self.balances.available.base = balance.available
+
+        if (balance := status.get_balance(self._quote_asset, connector)) is not None:
+            self.balances.total.quote = balance.total
+            self.balances.available.quote = balance.available
+
+        if market is not None and self._strategy_is_running:
+            self.market_prices.bid = market.bid
+            self.market_prices.ask = market.ask
+            self.market_prices.mid = market.mid
+
+        changed = self.balances.is_dirty or self.market_prices.is_dirty
+        changed = self.update_market_store(status) or changed
+
+        if self._restored_order_ids and (status_orders := status.orders) is not None:
+            self.reconcile_restored_orders(status_orders)
+
+        if changed:
+            self._manager.async_schedule_snapshot_save()
+
+        # Distances to mid move with the prices even when no order changed.
+        if changed and len(self._order_tracker):
+            self.update_active_order_sensor_data()
+
+        prices_missing = market is None or not market.mid
+
+        self._manager.status_poll_scheduler.async_report(self._instance_id, changed, prices_missing)
+
+    def update_market_store(self, status: HbotStatus) -> bool:
+        """Apply every market in the status, return whether any of them changed."""
+        has_new_markets = False
+
+        for status_market in status.markets:
+            market, created = self._market_store.get_or_create(status_market.connector, status_market.trading_pair)
+            has_new_markets = has_new_markets or created
+
+            if (balance := status.get_balance(status_market.base_asset, status_market.connector)) is not None:
+                market.balances.total.base = balance.total
+                market.balances.available.base = balance.available
+
+            if (balance := status.get_balance(status_market.quote_asset, status_market.connector)) is not None:
+                market.balances.total.quote = balance.total
+                market.balances.available.quote = balance.available
+
+            if self._strategy_is_running:
+                market.market_prices.bid = status_market.bid
+                market.market_prices.ask = status_market.ask
+                market.market_prices.mid = status_market.mid
+
+        changed = has_new_markets or any(
+            market.balances.is_dirty or market.market_prices.is_dirty for market in self._market_store.markets
+        )
+
+        self.update_market_sensors_data()
+
+        if has_new_markets:
+            self._manager.async_discover_instance_entities(self._hass, self)
+
+        return changed
+
+    def check_heartbeat(self, payload: str | bytes) -> None:
+        ts_field = HEARTBEAT_TS_FIELD if isinstance(payload, str) else HEARTBEAT_TS_FIELD_BYTES
+
+        if ts_field in payload:
+            self.set_available()
+        else:
+            self.set_unavailable()
+
     def check_availability(self, endpoint: str, payload: dict[str, Any]) -> bool:
         if not self.ready_for_updates:
             return False
 
-        if endpoint in ["hb", "status_updates"]:
+        if endpoint == "hb" or endpoint in AVAILABILITY_ENDPOINTS:
 
             if endpoint == "status_updates" and payload.get("type") == "availability":
                 if payload.get("msg") == "online":
@@ -598,11 +1393,73 @@ class HbotManager:
         self._services_registered = False
         self._status_update_frequency = DEFAULT_STATUS_UPDATE_INTERVAL
         self._strategy_name_helper = None
+        self._max_order_attributes = DEFAULT_MAX_ORDER_ATTRIBUTES
+        self._status_deadband = DEFAULT_STATUS_DEADBAND
+        self._diagnostic_sensors = DEFAULT_DIAGNOSTIC_SENSORS
+        self._invalid_endpoints = dict()
+        self._profiler = HbotProfiler()
+        self._state_write_scheduler = HbotStateWriteScheduler(profiler=self._profiler)
+        self._liveness_scheduler = HbotLivenessScheduler(self._async_handle_instance_timeout)
+        self._status_poll_scheduler = HbotStatusPollScheduler(self._async_poll_instance_status)
+        self._eviction_scheduler = HbotLivenessScheduler(self._async_evict_instance, DEFAULT_INSTANCE_TTL * 3600 or None)
+        self._max_instances = DEFAULT_MAX_INSTANCES
+        self._rejected_instance_messages = 0
+        self._rejected_instance_ids = set()
+        self._snapshot_store = None
+        self._snapshot_save_scheduled = False
+        self._entity_discovery_callbacks = list()
+        self._endpoint_handlers = {
+            **{endpoint: self.async_process_mqtt_data_update for endpoint in VALID_ENTITY_ENDPOINTS},
+            **{endpoint: self.async_process_mqtt_availability_update for endpoint in AVAILABILITY_ENDPOINTS},
+        }
 
     @property
     def status_update_frequency(self) -> int:
         return self._status_update_frequency
 
+    @property
+    def max_order_attributes(self) -> int:
+        return self._max_order_attributes
+
+    @property
+    def status_deadband(self) -> float:
+        return self._status_deadband
+
+    @property
+    def diagnostic_sensors(self) -> bool:
+        return self._diagnostic_sensors
+
+    @property
+    def profiler(self) -> HbotProfiler:
+        return self._profiler
+
+    @property
+    def state_write_scheduler(self) -> HbotStateWriteScheduler:
+        return self._state_write_scheduler
+
+    @property
+    def liveness_scheduler(self) -> HbotLivenessScheduler:
+        return self._liveness_scheduler
+
+    @property
+    def eviction_scheduler(self) -> HbotLivenessScheduler:
+        return self._eviction_scheduler
+
+    @property
+    def status_poll_scheduler(self) -> HbotStatusPollScheduler:
+        return self._status_poll_scheduler
+
+    @property
+    def max_instances(self) -> int:
+        return self._max_instances
+
+    @property
+    def subscription_topics(self) -> list[str]:
+        return [
+            *(ENDPOINT_TOPIC.format(endpoint) for endpoint in self._endpoint_handlers),
+            *(REPLY_ENDPOINT_TOPIC.format(endpoint) for endpoint in REPLY_ENDPOINTS),
+        ]
+
     @property
     def should_register_services(self) -> bool:
         if self._services_registered:
@@ -616,31 +1473,243 @@ class HbotManager:
     def strategy_name_helper(self) -> str:
         return self._strategy_name_helper
 
+    @property
+    def diagnostics_dict(self) -> dict[str, Any]:
+        return {
+            "status_update_frequency": self._status_update_frequency,
+            "max_order_attributes": self._max_order_attributes,
+            "status_deadband": self._status_deadband,
+            "state_write_interval": self._state_write_scheduler.write_interval,
+            "tracked_instances": len(self._liveness_scheduler),
+            "polled_instances": len(self._status_poll_scheduler),
+            "max_instances": self._max_instances,
+            "instance_ttl": self._eviction_scheduler.timeout,
+            "rejected_instance_messages": self._rejected_instance_messages,
+            "invalid_endpoints": dict(self._invalid_endpoints),
+            "instances": {
+                instance_id: hbot_instance.diagnostics_dict for instance_id, hbot_instance in self._instances.items()
+            },
+        }
+
     def unload_instances(self) -> None:
         for _id, instance in self._instances.items():
             instance.unload()
 
-    def extract_instance_id_endpoint(self, topic: str) -> tuple[str, str]:
+        self._state_write_scheduler.unload()
+        self._liveness_scheduler.unload()
+        self._eviction_scheduler.unload()
+        self._status_poll_scheduler.unload()
+        self._profiler.unload()
+
+    def _async_handle_instance_timeout(self, instance_id: str) -> None:
+        if (hbot_instance := self._instances.get(instance_id)) is not None:
+            hbot_instance.async_handle_timeout()
+
+    @property
+    def snapshot_data(self) -> dict[str, Any]:
+        return {
+            "instances": {
+                instance_id: hbot_instance.snapshot_data for instance_id, hbot_instance in self._instances.items()
+            },
+        }
+
+    async def async_restore_snapshot(self, hass: HomeAssistant) -> None:
+        """Recreate the instances saved before the last shutdown and discover their entities."""
+        self._snapshot_store = Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY)
+
+        if (data := await self._snapshot_store.async_load()) is None:
+            return
+
+        for instance_id, instance_data in data.get("instances", dict()).items():
+            if instance_id in self._instances:
+                continue
+
+            try:
+                hbot_instance = self._get_hbot_instance(hass, instance_id)
+            except InvalidHbotEvent:
+                continue
+
+            hbot_instance.restore_snapshot(instance_data)
+            self.async_discover_instance_entities(hass, hbot_instance)
+
+        _LOGGER.debug(f"Restored {len(self._instances)} Hummingbot instances from snapshot")
+
+    def async_precreate_known_instances(self, hass: HomeAssistant, entry: config_entries.ConfigEntry) -> None:
+        """Create the instances already known to the device and entity registries, with their entities."""
+        device_registry = dr.async_get(hass)
+        entity_registry = er.async_get(hass)
+
+        device_ids = {device.id for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id)}
+        device_ids.update(
+            entity_entry.device_id for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+            if entity_entry.device_id is not None
+        )
+
+        for device_id in device_ids:
+            if (device := device_registry.async_get(device_id)) is None:
+                continue
+
+            for domain, instance_id in device.identifiers:
+                if domain != DOMAIN or instance_id in self._instances:
+                    continue
+
+                try:
+                    self._get_hbot_instance(hass, instance_id)
+                except InvalidHbotEvent:
+                    continue
+
+        _LOGGER.debug(f"Prepared entities for {len(self._instances)} known Hummingbot instances")
+
+    @callback
+    def async_schedule_snapshot_save(self) -> None:
+        """Save the snapshot SNAPSHOT_SAVE_INTERVAL after the first change since the last save.
+
+        The delayed save is armed once per change, rearming it on every change
+        would keep pushing the write back while messages keep coming in.
+        """
+        if self._snapshot_store is None or self._snapshot_save_scheduled:
+            return
+
+        self._snapshot_save_scheduled = True
+        self._snapshot_store.async_delay_save(self._collect_snapshot_data, SNAPSHOT_SAVE_INTERVAL)
+
+    def _collect_snapshot_data(self) -> dict[str, Any]:
+        self._snapshot_save_scheduled = False
+
+        return self.snapshot_data
+
+    async def async_save_snapshot(self) -> None:
+        if self._snapshot_store is not None:
+            self._snapshot_save_scheduled = False
+            await self._snapshot_store.async_save(self.snapshot_data)
+
+    def _async_poll_instance_status(self, instance_id: str) -> None:
+        if (hbot_instance := self._instances.get(instance_id)) is None:
+            self._status_poll_scheduler.async_remove(instance_id)
+            return
+
+        hbot_instance.async_poll_status()
+
+    def _async_evict_instance(self, instance_id: str) -> None:
+        if (hbot_instance := self._instances.pop(instance_id, None)) is None:
+            return
+
+        _LOGGER.info(f"Removing Hummingbot instance {instance_id}, idle for more than {self._eviction_scheduler.timeout:g} seconds")
+
+        hbot_instance.unload()
+        hbot_instance.async_remove_entities()
+
+        self.async_schedule_snapshot_save()
+
+    def extract_instance_id_endpoint(self, topic: str) -> tuple[str, str, str | None]:
         topic_split = topic.split("/")
 
-        if len(topic_split) >= 3:
-            return topic_split[1], topic_split[-1]
+        if len(topic_split) == 3:
+            return topic_split[1], topic_split[2], None
+
+        # Command replies come in on hbot/<instance_id>/<reply endpoint>/<correlation_id>
+        if len(topic_split) == 4 and topic_split[2] in REPLY_ENDPOINTS:
+            return topic_split[1], topic_split[2], topic_split[3]
 
         raise InvalidHbotEvent("Invalid Instance ID")
 
-    def send_import_command(
-        self, hass: HomeAssistant, instance_id: str, strategy_name: str
-    ) -> None:
-        hbot_instance = self._get_hbot_instance(hass, instance_id)
-        hbot_instance.send_import_command(strategy_name)
+    def select_instances(
+        self, strategy: str | None = None, trading_pair: str | None = None
+    ) -> list[HbotInstance]:
+        return [
+            hbot_instance for hbot_instance in self._instances.values()
+            if (strategy is None or hbot_instance.strategy_name == strategy)
+            and (trading_pair is None or trading_pair in hbot_instance.trading_pairs)
+        ]
+
+    async def async_send_bulk_command(
+        self,
+        hass: HomeAssistant,
+        command: str,
+        instance_ids: list[str] | None = None,
+        strategy: str | None = None,
+        trading_pair: str | None = None,
+        data: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Publish a command to every targeted instance concurrently.
+
+        Explicit instance IDs are combined with the instances matching the
+        strategy and trading pair filters. With a timeout the replies are
+        collected too, instances that do not answer in time count as failed.
+        """
+        targets = dict()
+        failed = dict()
+
+        for instance_id in instance_ids or list():
+            if (hbot_instance := self._instances.get(instance_id)) is None:
+                failed[instance_id] = "Unknown instance"
+                continue
+
+            targets[instance_id] = hbot_instance
+
+        if strategy is not None or trading_pair is not None:
+            for hbot_instance in self.select_instances(strategy, trading_pair):
+                targets.setdefault(hbot_instance.instance_id, hbot_instance)
+
+        results = await asyncio.gather(
+            *(hbot_instance.async_send_command(command, data, timeout) for hbot_instance in targets.values()),
+            return_exceptions=True,
+        )
+
+        succeeded = list()
+        replies = dict()
+
+        for instance_id, result in zip(targets, results):
+            if isinstance(result, asyncio.TimeoutError):
+                failed[instance_id] = "No reply received"
+            elif isinstance(result, Exception):
+                failed[instance_id] = str(result) or type(result).__name__
+            else:
+                succeeded.append(instance_id)
+                replies[instance_id] = result
+
+        _LOGGER.debug(f"Sent {command} to {len(succeeded)} instances, {len(failed)} failed")
+
+        return {
+            "command": command,
+            "targeted": len(succeeded) + len(failed),
+            "succeeded": succeeded,
+            "failed": failed,
+            **({"replies": replies} if timeout is not None else dict()),
+        }
 
     def _get_hbot_instance(
         self, hass: HomeAssistant, instance_id: str
     ) -> HbotInstance:
-        if instance_id not in self._instances.keys():
-            self._instances[instance_id] = HbotInstance(self, instance_id, hass)
+        if (hbot_instance := self._instances.get(instance_id)) is not None:
+            return hbot_instance
+
+        if not _INSTANCE_ID_RE.fullmatch(instance_id):
+            self._rejected_instance_messages += 1
+            raise InvalidHbotEvent(f"Invalid Instance ID: {instance_id}")
+
+        if len(self._instances) >= self._max_instances:
+            self._rejected_instance_messages += 1
 
-        return self._instances[instance_id]
+            if instance_id not in self._rejected_instance_ids and len(self._rejected_instance_ids) < MAX_REJECTED_INSTANCE_WARNINGS:
+                self._rejected_instance_ids.add(instance_id)
+                _LOGGER.warning(
+                    f"Ignoring Hummingbot instance {instance_id}, limit of {self._max_instances} instances reached. "
+                    f"Raise the maximum number of instances in the integration options to track it."
+                )
+
+            raise InvalidHbotEvent("Too many instances")
+
+        hbot_instance = self._instances[instance_id] = HbotInstance(self, instance_id, hass)
+
+        # Instances that never send a message still expire, whatever created them.
+        self._eviction_scheduler.async_touch(instance_id)
+
+        # Entities are discovered once here, later ones (markets, diagnostics) where they appear.
+        self.async_discover_instance_entities(hass, hbot_instance)
+
+        return hbot_instance
 
     def update_with_config_entry(self) -> None:
 
@@ -652,9 +1721,106 @@ class HbotManager:
             _LOGGER.debug(f"Updating strategy name helper to {new_val}")
             self.set_strategy_name_helper(new_val)
 
+        if (new_val := self._config_entry.options.get(CONF_MAX_ORDER_ATTRIBUTES, None)) is not None:
+            _LOGGER.debug(f"Updating max order attributes to {new_val}")
+            self.set_max_order_attributes(new_val)
+
+        if (new_val := self._config_entry.options.get(CONF_STATUS_DEADBAND, None)) is not None:
+            _LOGGER.debug(f"Updating status deadband to {new_val}%")
+            self.set_status_deadband(new_val)
+
+        if (new_val := self._config_entry.options.get(CONF_STATE_WRITE_INTERVAL, None)) is not None:
+            _LOGGER.debug(f"Updating state write interval to {new_val}ms")
+            self.set_state_write_interval(new_val)
+
+        if (new_val := self._config_entry.options.get(CONF_DIAGNOSTIC_SENSORS, None)) is not None:
+            _LOGGER.debug(f"Updating diagnostic sensors to {new_val}")
+            self.set_diagnostic_sensors(new_val)
+
+        if (new_val := self._config_entry.options.get(CONF_MAX_INSTANCES, None)) is not None:
+            _LOGGER.debug(f"Updating max instances to {new_val}")
+            self.set_max_instances(new_val)
+
+        if (new_val := self._config_entry.options.get(CONF_INSTANCE_TTL, None)) is not None:
+            _LOGGER.debug(f"Updating instance TTL to {new_val}h")
+            self.set_instance_ttl(new_val)
+
     def set_strategy_name_helper(self, strategy_name_helper: str) -> None:
         self._strategy_name_helper = strategy_name_helper
 
+    def set_max_order_attributes(self, value: Any) -> None:
+        if value is None:
+            return
+
+        try:
+            self._max_order_attributes = max(int(value), 0)
+        except Exception:
+            _LOGGER.warning(f"Invalid max order attributes: {value}")
+
+    def set_status_deadband(self, value: Any) -> None:
+        if value is None:
+            return
+
+        try:
+            self._status_deadband = max(float(value), 0.0) / 100
+        except Exception:
+            _LOGGER.warning(f"Invalid status deadband: {value}")
+            return
+
+        for _id, instance in self._instances.items():
+            instance.set_status_deadband(self._status_deadband)
+
+    def set_max_instances(self, value: Any) -> None:
+        if value is None:
+            return
+
+        try:
+            self._max_instances = max(int(value), 1)
+        except Exception:
+            _LOGGER.warning(f"Invalid max instances: {value}")
+            return
+
+        self._rejected_instance_ids = set()
+
+    def set_instance_ttl(self, value: Any) -> None:
+        if value is None:
+            return
+
+        try:
+            ttl = float(value) * 3600
+        except Exception:
+            _LOGGER.warning(f"Invalid instance TTL: {value}")
+            return
+
+        ttl = ttl if ttl > 0 else None
+
+        if ttl == self._eviction_scheduler.timeout:
+            return
+
+        self._eviction_scheduler.set_timeout(ttl)
+
+        for instance_id in self._instances:
+            self._eviction_scheduler.async_touch(instance_id)
+
+    def set_diagnostic_sensors(self, value: Any) -> None:
+        if self._diagnostic_sensors == bool(value):
+            return
+
+        self._diagnostic_sensors = bool(value)
+
+        if self._diagnostic_sensors:
+            for hbot_instance in list(self._instances.values()):
+                self.async_discover_instance_entities(hbot_instance.hass, hbot_instance)
+
+    def set_state_write_interval(self, value: Any) -> None:
+        if value is None:
+            return
+
+        try:
+            self._state_write_scheduler.set_write_interval(float(value) / 1000)
+        except Exception:
+            _LOGGER.warning(f"Invalid state write interval: {value}")
+
     def set_status_update_frequency(self, value: Any) -> None:
         if value is None:
             return
@@ -663,58 +1829,106 @@ class HbotManager:
             return
 
         try:
-            self._status_update_frequency = int(value)
+            value = int(value)
         except Exception:
             _LOGGER.warning(f"Invalid status update frequency: {value}")
+            return
 
-    def get_hbot_instance_endpoint_event(
-        self, hass: HomeAssistant, msg: mqtt.ReceiveMessage
-    ) -> tuple[HbotInstance, str, dict[str, Any]]:
-        try:
-            instance_id, endpoint = self.extract_instance_id_endpoint(msg.topic)
+        if value < STATUS_POLL_MIN_INTERVAL:
+            _LOGGER.warning(f"Status update frequency {value} is below the minimum of {STATUS_POLL_MIN_INTERVAL} seconds, ignoring it")
+            return
 
-            hbot_instance = self._get_hbot_instance(hass, instance_id)
-            hbot_instance.async_update_last_received()
+        self._status_update_frequency = value
+        self._status_poll_scheduler.set_interval(self._status_update_frequency)
 
-            event = hbot_instance.extract_event_payload(endpoint, msg.payload)
+    def async_register_entity_discovery(
+        self,
+        discover_entities: Callable[HomeAssistant, HbotInstance],
+        async_add_entities: AddEntitiesCallback
+    ) -> Callable[[], None]:
+        discovery = (discover_entities, async_add_entities)
+        self._entity_discovery_callbacks.append(discovery)
 
-            return hbot_instance, endpoint, event
+        @callback
+        def async_unregister_entity_discovery() -> None:
+            if discovery in self._entity_discovery_callbacks:
+                self._entity_discovery_callbacks.remove(discovery)
 
-        except InvalidHbotEvent:
-            raise
+        return async_unregister_entity_discovery
 
     def async_process_entity_mqtt_discovery(
         self,
         hass: HomeAssistant,
-        msg: mqtt.ReceiveMessage,
+        hbot_instance: HbotInstance,
         discover_entities: Callable[HomeAssistant, HbotInstance],
         async_add_entities: AddEntitiesCallback
+    ) -> None:
+        entities = discover_entities(hass, hbot_instance)
+
+        if entities is None:
+            return
+
+        if len(entities) > 0:
+            async_add_entities(entities, False)
+
+    def async_discover_instance_entities(
+        self, hass: HomeAssistant, hbot_instance: HbotInstance
+    ) -> None:
+        for discover_entities, async_add_entities in list(self._entity_discovery_callbacks):
+            self.async_process_entity_mqtt_discovery(hass, hbot_instance, discover_entities, async_add_entities)
+
+    def async_route_mqtt_message(
+        self, hass: HomeAssistant, msg: mqtt.ReceiveMessage
     ) -> None:
         try:
-            hbot_instance, endpoint, event = self.get_hbot_instance_endpoint_event(hass, msg)
+            instance_id, endpoint, correlation_id = self.extract_instance_id_endpoint(msg.topic)
         except InvalidHbotEvent:
             return
 
-        if event is None:
+        if (handler := self._endpoint_handlers.get(endpoint)) is None:
+            self._invalid_endpoints[endpoint] = self._invalid_endpoints.get(endpoint, 0) + 1
             return
 
-        entities = discover_entities(hass, hbot_instance)
+        if self._profiler.is_running:
+            self._profiler.runcall(handler, hass, instance_id, endpoint, msg.payload, correlation_id)
+            return
 
-        if entities is None:
+        handler(hass, instance_id, endpoint, msg.payload, correlation_id)
+
+    def async_process_mqtt_availability_update(
+        self, hass: HomeAssistant, instance_id: str, endpoint: str, payload: str | bytes, correlation_id: str | None = None
+    ) -> None:
+        try:
+            hbot_instance = self._get_hbot_instance(hass, instance_id)
+        except InvalidHbotEvent:
             return
 
-        if len(entities) > 0:
-            async_add_entities(entities, False)
+        hbot_instance.async_update_last_received()
+        hbot_instance.metrics.endpoint(endpoint).received += 1
+
+        try:
+            hbot_instance.extract_event_payload(endpoint, payload)
+        except InvalidHbotEvent:
+            return
 
     def async_process_mqtt_data_update(
-        self, hass: HomeAssistant, msg: mqtt.ReceiveMessage
+        self, hass: HomeAssistant, instance_id: str, endpoint: str, payload: str | bytes, correlation_id: str | None = None
     ) -> None:
         try:
-            hbot_instance, endpoint, event = self.get_hbot_instance_endpoint_event(hass, msg)
+            hbot_instance = self._get_hbot_instance(hass, instance_id)
         except InvalidHbotEvent:
             return
 
-        if event is None:
+        hbot_instance.async_update_last_received()
+        hbot_instance.metrics.endpoint(endpoint).received += 1
+
+        try:
+            event = hbot_instance.extract_event_payload(endpoint, payload, correlation_id)
+        except InvalidHbotEvent:
             return
 
-        hbot_instance.update_data(endpoint, event)
+        if event is not None:
+            hbot_instance.process_event(endpoint, event, correlation_id)
+
+        hbot_instance.check_trade_stats_expiry()
+        hbot_instance.update_ingest_metrics_sensor_data()
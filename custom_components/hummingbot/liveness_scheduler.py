@@ -0,0 +1,49 @@
+"""Fleet-wide liveness tracking for Hummingbot instances."""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from .const import INSTANCE_TIMEOUT_SECONDS
+from .deadline_scheduler import HbotDeadlineScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class HbotLivenessScheduler(HbotDeadlineScheduler):
+    """Fire a callback when an instance has been silent for the timeout."""
+
+    def __init__(
+        self,
+        on_timeout: Callable[[str], None],
+        timeout: float | None = INSTANCE_TIMEOUT_SECONDS,
+    ):
+        super().__init__()
+        self._on_timeout = on_timeout
+        self._timeout = timeout
+
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+    def set_timeout(self, timeout: float | None) -> None:
+        """Change the timeout, None disables the scheduler.
+
+        Tracked deadlines keep their old timeout until the next touch.
+        """
+        self._timeout = timeout
+
+        if timeout is None:
+            self.unload()
+
+    def async_touch(self, instance_id: str) -> None:
+        if self._timeout is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._async_set_deadline(instance_id, loop.time() + self._timeout, loop)
+
+    def _async_expired(self, instance_ids: list[str]) -> None:
+        for instance_id in instance_ids:
+            self._on_timeout(instance_id)
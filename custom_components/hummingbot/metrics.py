@@ -0,0 +1,114 @@
+"""Ingest metrics for Hummingbot instances."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds of the latency buckets in seconds, the last bucket is open ended.
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1)
+
+DROP_NOT_READY = "not_ready"
+DROP_DECODE_ERROR = "decode_error"
+
+
+class HbotLatencyHistogram:
+    __slots__ = ("_buckets", "_count", "_total", "_max")
+
+    def __init__(self):
+        self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self._count += 1
+        self._total += seconds
+
+        if seconds > self._max:
+            self._max = seconds
+
+    @property
+    def data_dict(self) -> dict[str, Any]:
+        bucket_labels = [f"le_{bound * 1e6:g}us" for bound in LATENCY_BUCKETS] + ["inf"]
+
+        return {
+            "count": self._count,
+            "mean_ms": round(self.mean * 1e3, 4),
+            "max_ms": round(self._max * 1e3, 4),
+            "buckets": dict(zip(bucket_labels, self._buckets)),
+        }
+
+
+class HbotEndpointMetrics:
+    __slots__ = ("received", "dropped", "decode_time", "update_time")
+
+    def __init__(self):
+        self.received = 0
+        self.dropped = {
+            DROP_NOT_READY: 0,
+            DROP_DECODE_ERROR: 0,
+        }
+        self.decode_time = HbotLatencyHistogram()
+        self.update_time = HbotLatencyHistogram()
+
+    @property
+    def data_dict(self) -> dict[str, Any]:
+        return {
+            "received": self.received,
+            "dropped": dict(self.dropped),
+            "decode_time": self.decode_time.data_dict,
+            "update_time": self.update_time.data_dict,
+        }
+
+
+class HbotInstanceMetrics:
+    def __init__(self):
+        self._endpoints = dict()
+        self.state_writes = 0
+
+    def endpoint(self, endpoint: str) -> HbotEndpointMetrics:
+        if (metrics := self._endpoints.get(endpoint)) is None:
+            metrics = self._endpoints[endpoint] = HbotEndpointMetrics()
+
+        return metrics
+
+    @property
+    def received(self) -> int:
+        return sum(m.received for m in self._endpoints.values())
+
+    @property
+    def dropped(self) -> int:
+        return sum(sum(m.dropped.values()) for m in self._endpoints.values())
+
+    @property
+    def summary_dict(self) -> dict[str, Any]:
+        return {
+            "state_writes": self.state_writes,
+            **{
+                f"{endpoint}_received": m.received for endpoint, m in self._endpoints.items()
+            },
+            **{
+                f"{endpoint}_dropped": sum(m.dropped.values()) for endpoint, m in self._endpoints.items()
+            },
+            **{
+                f"{endpoint}_update_mean_ms": round(m.update_time.mean * 1e3, 4) for endpoint, m in self._endpoints.items()
+            },
+        }
+
+    @property
+    def data_dict(self) -> dict[str, Any]:
+        return {
+            "received": self.received,
+            "dropped": self.dropped,
+            "state_writes": self.state_writes,
+            "endpoints": {endpoint: m.data_dict for endpoint, m in self._endpoints.items()},
+        }
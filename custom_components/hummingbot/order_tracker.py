@@ -0,0 +1,352 @@
+"""Compact storage for the orders tracked on a Hummingbot instance."""
+from __future__ import annotations
+
+import sys
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except Exception:
+        return 0.0
+
+
+def _pct(value: float | None, reference: float | None) -> float | None:
+    if value is None or not reference:
+        return None
+
+    return round(value / reference * 100, 6)
+
+
+class HbotOrder:
+    __slots__ = (
+        "order_type",
+        "trading_pair",
+        "amount",
+        "price",
+        "order_side",
+        "creation_timestamp",
+    )
+
+    def __init__(
+        self,
+        order_type: str,
+        trading_pair: str,
+        amount: float,
+        price: float,
+        order_side: str,
+        creation_timestamp: Any,
+    ):
+        self.order_type = order_type
+        self.trading_pair = trading_pair
+        self.amount = amount
+        self.price = price
+        self.order_side = order_side
+        self.creation_timestamp = creation_timestamp
+
+    @classmethod
+    def from_data_dict(cls, data: dict[str, Any]) -> HbotOrder:
+        return cls(
+            sys.intern(str(data["t"])),
+            sys.intern(str(data["tp"])),
+            _to_float(data["a"]),
+            _to_float(data["p"]),
+            sys.intern(str(data["s"])),
+            data.get("ts"),
+        )
+
+    @classmethod
+    def from_event_data(cls, order_side: str, order_data: dict[str, Any]) -> HbotOrder:
+        return cls(
+            sys.intern(str(order_data["type"]).split(".")[-1]),
+            sys.intern(str(order_data["trading_pair"])),
+            _to_float(order_data["amount"]),
+            _to_float(order_data["price"]),
+            sys.intern(order_side),
+            order_data["creation_timestamp"],
+        )
+
+    @property
+    def memory_usage(self) -> int:
+        return (
+            sys.getsizeof(self) +
+            sys.getsizeof(self.amount) +
+            sys.getsizeof(self.price) +
+            sys.getsizeof(self.creation_timestamp)
+        )
+
+    @property
+    def data_dict(self) -> dict[str, Any]:
+        return {
+            "t": self.order_type,
+            "tp": self.trading_pair,
+            "a": self.amount,
+            "p": self.price,
+            "s": self.order_side,
+            "ts": self.creation_timestamp,
+        }
+
+
+class HbotOrderBookSide:
+    """Orders of one side kept sorted by price, with running depth totals.
+
+    Lookups bisect the sorted keys, the best price is at one end of the list.
+    """
+
+    def __init__(self, is_bid: bool):
+        self._is_bid = is_bid
+        self._keys = list()
+        self._amount = 0.0
+        self._notional = 0.0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def amount(self) -> float:
+        return self._amount if self._keys else 0.0
+
+    @property
+    def notional(self) -> float:
+        return self._notional if self._keys else 0.0
+
+    @property
+    def best_price(self) -> float | None:
+        if not self._keys:
+            return None
+
+        return self._keys[-1][0] if self._is_bid else self._keys[0][0]
+
+    def add(self, order_id: str, order: HbotOrder) -> None:
+        insort(self._keys, (order.price, order_id))
+        self._amount += order.amount
+        self._notional += order.amount * order.price
+
+    def remove(self, order_id: str, order: HbotOrder) -> None:
+        index = bisect_left(self._keys, (order.price, order_id))
+
+        if index < len(self._keys) and self._keys[index] == (order.price, order_id):
+            del self._keys[index]
+            self._amount -= order.amount
+            self._notional -= order.amount * order.price
+
+        if not self._keys:
+            self._amount = 0.0
+            self._notional = 0.0
+
+    def reduce(self, order: HbotOrder, amount: float) -> None:
+        self._amount -= amount
+        self._notional -= amount * order.price
+
+    def iter_from_best(self) -> Iterator[tuple[float, str]]:
+        """Yield (price, order_id) from the best price outwards."""
+        return reversed(self._keys) if self._is_bid else iter(self._keys)
+
+    def nearest_price(self, price: float) -> float | None:
+        index = bisect_left(self._keys, (price,))
+        candidates = [self._keys[i][0] for i in (index - 1, index) if 0 <= i < len(self._keys)]
+
+        return min(candidates, key=lambda p: abs(p - price), default=None)
+
+    def depth_data(self, orders: dict[str, HbotOrder], levels: int) -> list[list[float]]:
+        """Return [price, cumulative amount] per price level, from the best price outwards."""
+        depth = list()
+        cumulative = 0.0
+
+        for price, order_id in self.iter_from_best():
+            cumulative += orders[order_id].amount
+
+            if depth and depth[-1][0] == price:
+                depth[-1][1] = cumulative
+            elif len(depth) < levels:
+                depth.append([price, cumulative])
+            else:
+                break
+
+        return depth
+
+
+class HbotOrderBook:
+    """Buy and sell sides of the orders on one trading pair."""
+
+    def __init__(self):
+        self._bids = HbotOrderBookSide(is_bid=True)
+        self._asks = HbotOrderBookSide(is_bid=False)
+
+    def __len__(self) -> int:
+        return len(self._bids) + len(self._asks)
+
+    @property
+    def bids(self) -> HbotOrderBookSide:
+        return self._bids
+
+    @property
+    def asks(self) -> HbotOrderBookSide:
+        return self._asks
+
+    def side(self, order: HbotOrder) -> HbotOrderBookSide:
+        return self._bids if order.order_side == "buy" else self._asks
+
+    def summary_data(self, mid_price: float | None = None) -> dict[str, Any]:
+        best_bid, best_ask = self._bids.best_price, self._asks.best_price
+        spread = best_ask - best_bid if best_bid is not None and best_ask is not None else None
+        nearest_distance = None
+
+        if mid_price:
+            nearest_prices = [p for p in (self._bids.nearest_price(mid_price), self._asks.nearest_price(mid_price)) if p is not None]
+            nearest_distance = min((abs(p - mid_price) for p in nearest_prices), default=None)
+
+        return {
+            "buy_notional": self._bids.notional,
+            "sell_notional": self._asks.notional,
+            "buy_depth": self._bids.amount,
+            "sell_depth": self._asks.amount,
+            "best_bid": best_bid,
+            "best_ask": best_ask,
+            "spread": spread,
+            "spread_pct": _pct(spread, mid_price),
+            "bid_distance_pct": _pct(mid_price - best_bid if mid_price and best_bid is not None else None, mid_price),
+            "ask_distance_pct": _pct(best_ask - mid_price if mid_price and best_ask is not None else None, mid_price),
+            "nearest_order_distance_pct": _pct(nearest_distance, mid_price),
+        }
+
+    def depth_data(self, orders: dict[str, HbotOrder], levels: int) -> dict[str, list[list[float]]]:
+        return {
+            "buy": self._bids.depth_data(orders, levels),
+            "sell": self._asks.depth_data(orders, levels),
+        }
+
+    def nearest_orders(self, mid_price: float | None = None, limit: int | None = None) -> list[tuple[float, str]]:
+        """Return up to limit (relative distance to mid, order_id), nearest first.
+
+        Without a mid price the middle of the own best bid and ask is used.
+        """
+        best_bid, best_ask = self._bids.best_price, self._asks.best_price
+        reference = mid_price or ((best_bid + best_ask) / 2 if best_bid and best_ask else best_bid or best_ask)
+
+        if not reference:
+            return list()
+
+        ranked = [((reference - price) / reference, order_id) for price, order_id in islice(self._bids.iter_from_best(), limit)]
+        ranked.extend(((price - reference) / reference, order_id) for price, order_id in islice(self._asks.iter_from_best(), limit))
+        ranked.sort()
+
+        return ranked[:limit]
+
+
+class HbotOrderTracker:
+    """Tracked orders by ID, with a price sorted book per trading pair."""
+
+    def __init__(self):
+        self._orders = dict()
+        self._records_memory_usage = 0
+        self._books = dict()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+    @property
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the tracker, interned strings excluded."""
+        return sys.getsizeof(self._orders) + self._records_memory_usage
+
+    @property
+    def trading_pairs(self) -> list[str]:
+        return list(self._books)
+
+    def get(self, order_id: str) -> HbotOrder | None:
+        return self._orders.get(order_id)
+
+    def get_book(self, trading_pair: str) -> HbotOrderBook | None:
+        return self._books.get(trading_pair)
+
+    def add(self, order_id: str, order_side: str, order_data: dict[str, Any]) -> HbotOrder:
+        return self._insert(order_id, HbotOrder.from_event_data(order_side, order_data))
+
+    def restore(self, order_id: str, order_data: dict[str, Any]) -> HbotOrder:
+        return self._insert(order_id, HbotOrder.from_data_dict(order_data))
+
+    def remove(self, order_id: str) -> HbotOrder | None:
+        order = self._orders.pop(order_id, None)
+
+        if order is not None:
+            self._records_memory_usage -= sys.getsizeof(order_id) + order.memory_usage
+            book = self._books[order.trading_pair]
+            book.side(order).remove(order_id, order)
+
+            if not len(book):
+                del self._books[order.trading_pair]
+
+        return order
+
+    def fill(self, order_id: str, amount: float) -> HbotOrder | None:
+        """Take a filled amount off an order, remove the order once nothing is left."""
+        if (order := self._orders.get(order_id)) is None:
+            return None
+
+        if order.amount - amount <= order.amount * 1e-9:
+            return self.remove(order_id)
+
+        self._books[order.trading_pair].side(order).reduce(order, amount)
+        order.amount -= amount
+
+        return order
+
+    def clear(self) -> None:
+        self._orders = dict()
+        self._records_memory_usage = 0
+        self._books = dict()
+
+    def summary_data(self, trading_pair: str | None = None, mid_price: float | None = None) -> dict[str, Any]:
+        """Order counts over every pair, prices and depth of the given pair only."""
+        book = self._books.get(trading_pair) or HbotOrderBook()
+
+        return {
+            "buy_orders": sum(len(book.bids) for book in self._books.values()),
+            "sell_orders": sum(len(book.asks) for book in self._books.values()),
+            "trading_pair": trading_pair,
+            **book.summary_data(mid_price),
+        }
+
+    def books_data(self, mid_prices: dict[str, float]) -> dict[str, dict[str, Any]]:
+        return {trading_pair: book.summary_data(mid_prices.get(trading_pair)) for trading_pair, book in self._books.items()}
+
+    def depth_data(self, trading_pair: str | None, levels: int) -> dict[str, list[list[float]]]:
+        book = self._books.get(trading_pair) or HbotOrderBook()
+
+        return book.depth_data(self._orders, levels)
+
+    def _insert(self, order_id: str, order: HbotOrder) -> HbotOrder:
+        self.remove(order_id)
+
+        self._orders[order_id] = order
+        self._records_memory_usage += sys.getsizeof(order_id) + order.memory_usage
+
+        if (book := self._books.get(order.trading_pair)) is None:
+            book = self._books[order.trading_pair] = HbotOrderBook()
+
+        book.side(order).add(order_id, order)
+
+        return order
+
+    def orders_data(self, limit: int | None = None, mid_prices: dict[str, float] | None = None) -> dict[str, dict[str, Any]]:
+        """Return up to limit orders, nearest to their pair's mid price first when mid_prices is given."""
+        if mid_prices is None:
+            return {oid: o.data_dict for oid, o in islice(self._orders.items(), limit)}
+
+        ranked = list()
+
+        for trading_pair, book in self._books.items():
+            ranked.extend(book.nearest_orders(mid_prices.get(trading_pair), limit))
+
+        if len(self._books) > 1:
+            ranked.sort()
+
+        return {oid: self._orders[oid].data_dict for _, oid in ranked[:limit]}
@@ -0,0 +1,104 @@
+"""On-demand profiling of the Hummingbot ingest and state write paths."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import pstats
+import time
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import _LOGGER, DEFAULT_PROFILE_TOP_FUNCTIONS, PROFILE_FILE_PREFIX
+
+
+class HbotProfiler:
+    """Profile only the callbacks routed through `runcall` for a bounded window.
+
+    Other code on the event loop is not profiled, the report covers the MQTT
+    callbacks and the deferred entity state writes of the integration.
+    """
+
+    def __init__(self):
+        self._profile = None
+        self._started = None
+        self._stop_handle = None
+        self._active = False
+        self._calls = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._profile is not None
+
+    def runcall(self, func: Callable[..., Any], *args) -> Any:
+        if self._profile is None or self._active:
+            return func(*args)
+
+        self._active = True
+        self._calls += 1
+
+        try:
+            return self._profile.runcall(func, *args)
+        finally:
+            self._active = False
+
+    def async_start(self, hass: HomeAssistant, duration: float) -> None:
+        if self._profile is not None:
+            raise HomeAssistantError("Profiling is already running")
+
+        self._profile = cProfile.Profile()
+        self._started = time.time()
+        self._calls = 0
+        self._stop_handle = asyncio.get_running_loop().call_later(
+            duration, lambda: hass.async_create_task(self.async_stop(hass))
+        )
+
+        _LOGGER.info(f"Profiling started for {duration:g} seconds")
+
+    async def async_stop(self, hass: HomeAssistant, top_functions: int = DEFAULT_PROFILE_TOP_FUNCTIONS) -> str | None:
+        if self._profile is None:
+            return None
+
+        if self._stop_handle is not None:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+
+        profile, started, calls = self._profile, self._started, self._calls
+        self._profile = None
+
+        base_path = hass.config.path(f"{PROFILE_FILE_PREFIX}_{int(started)}")
+
+        summary_path = await hass.async_add_executor_job(
+            self._write_results, profile, base_path, time.time() - started, calls, top_functions
+        )
+
+        _LOGGER.info(f"Profiling stopped, results written to {summary_path}")
+
+        return summary_path
+
+    def unload(self) -> None:
+        if self._stop_handle is not None:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+
+        self._profile = None
+
+    @staticmethod
+    def _write_results(profile: cProfile.Profile, base_path: str, elapsed: float, calls: int, top_functions: int) -> str:
+        profile.dump_stats(f"{base_path}.prof")
+
+        stream = io.StringIO()
+        stream.write(f"Hummingbot profile: {calls} callbacks profiled over {elapsed:.1f} seconds\n\n")
+
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_functions)
+
+        summary_path = f"{base_path}.txt"
+
+        with open(summary_path, "w", encoding="utf-8") as summary:
+            summary.write(stream.getvalue())
+
+        return summary_path
@@ -1,25 +1,34 @@
 """Support for collecting data from Hummingbot instances into sensors."""
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.components import mqtt
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import slugify
 
 from .base import HbotBase
 from .const import (
     _LOGGER,
-    TOPIC,
     TYPE_ENTITY_ACTIVE_ORDERS,
+    TYPE_ENTITY_INGEST_METRICS,
     TYPE_ENTITY_STRATEGY_STATUS,
     TYPES_SENSORS,
+    TYPES_TRADE_STATS_SENSORS,
+    UNRECORDED_ATTRIBUTES,
 )
 from .hummingbot_coordinator import HbotInstance, HbotManager
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 def discover_sensors(
     hass: HomeAssistant, hbot_instance: HbotInstance
@@ -43,6 +52,24 @@ def discover_sensors(
 
         sensors.append(hbot_instance.add_sensor(new_sensor))
 
+    if hbot_instance.diagnostic_sensors and hbot_instance.get_sensor(TYPE_ENTITY_INGEST_METRICS) is None:
+        new_sensor = HbotSensor(hass, hbot_instance, TYPE_ENTITY_INGEST_METRICS, unit_of_measurement="messages")
+
+        _LOGGER.debug(f"Adding diagnostic sensor {new_sensor.name}")
+
+        sensors.append(hbot_instance.add_sensor(new_sensor))
+
+    for market in hbot_instance.market_store.markets:
+
+        if hbot_instance.get_sensor(market.entity_type) is not None:
+            continue
+
+        new_sensor = HbotSensor(hass, hbot_instance, market.entity_type)
+
+        _LOGGER.debug(f"Adding market sensor {new_sensor.name}")
+
+        sensors.append(hbot_instance.add_sensor(new_sensor))
+
     return sensors
 
 
@@ -52,11 +79,7 @@ async def async_setup_entry(
     """Set up the Hummingbot sensors entry."""
     _LOGGER.debug("Set up sensors start.")
 
-    @callback
-    def async_sensor_event_received(msg: mqtt.ReceiveMessage) -> None:
-        HbotManager.instance().async_process_entity_mqtt_discovery(hass, msg, discover_sensors, async_add_entities)
-
-    entry.async_on_unload(await mqtt.async_subscribe(hass, TOPIC, async_sensor_event_received, 0))
+    entry.async_on_unload(HbotManager.instance().async_register_entity_discovery(discover_sensors, async_add_entities))
 
     _LOGGER.debug("Set up sensors done.")
 
@@ -64,6 +87,8 @@ async def async_setup_entry(
 class HbotSensor(HbotBase, SensorEntity):
     """Representation of an Hummingbot sensor."""
 
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
     def __init__(self, *args, **kwargs):
         """Initialize the sensor."""
         super().__init__(*args, **kwargs)
@@ -71,16 +96,45 @@ class HbotSensor(HbotBase, SensorEntity):
         if self._hbot_entity_type == TYPE_ENTITY_STRATEGY_STATUS:
             self._attr_device_class = SensorDeviceClass.ENUM
 
+        elif self._hbot_entity_type == TYPE_ENTITY_INGEST_METRICS:
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+        elif self._hbot_entity_type in TYPES_TRADE_STATS_SENSORS:
+            self._attr_state_class = SensorStateClass.TOTAL
+
+        self._event_builder = None
+
     def _slug(self) -> str:
         return f"sensor.{slugify(self._attr_name)}"
 
     def set_event(self, event: dict[str, Any]) -> None:
         """Update the sensor with the most recent event."""
+        self._event_builder = None
+        self._apply_event(event)
+
+        self.async_schedule_write_ha_state()
+
+    def set_event_builder(self, build_event: Callable[[], dict[str, Any]]) -> None:
+        """Update the sensor with an event built only when the state is written."""
+        self._event_builder = build_event
+
+        self.async_schedule_write_ha_state()
+
+    def async_safe_write_ha_state(self) -> None:
+        if (build_event := self._event_builder) is not None:
+            self._event_builder = None
+            self._apply_event(build_event())
+
+        super().async_safe_write_ha_state()
+
+    def _apply_event(self, event: dict[str, Any]) -> None:
         ev = {}
         ev.update(event)
 
         self._attr_native_value = ev.get(self._state_key, None)
 
-        self.update_attributes_with_event(ev)
+        # Realized PnL is in the quote asset the state was picked from.
+        if self._hbot_entity_type in TYPES_TRADE_STATS_SENSORS:
+            self._attr_native_unit_of_measurement = ev.get("quote_asset")
 
-        self.async_safe_write_ha_state()
+        self.update_attributes_with_event(ev)
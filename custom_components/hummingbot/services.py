@@ -3,35 +3,144 @@ from __future__ import annotations
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 
-from .const import ATTR_INSTANCE_ID, ATTR_STRATEGY_NAME, DOMAIN
+from .const import (
+    ATTR_DURATION,
+    ATTR_INSTANCE_ID,
+    ATTR_STRATEGY_NAME,
+    ATTR_TARGET_STRATEGY,
+    ATTR_TIMEOUT,
+    ATTR_TRADING_PAIR,
+    COMMAND_IMPORT,
+    COMMAND_START,
+    COMMAND_STATUS,
+    COMMAND_STOP,
+    DEFAULT_PROFILE_DURATION,
+    DOMAIN,
+    MAX_COMMAND_TIMEOUT,
+    MAX_PROFILE_DURATION,
+)
 from .hummingbot_coordinator import HbotManager
 
 IMPORT_STRATEGY = "import_strategy"
+START_STRATEGY = "start_strategy"
+STOP_STRATEGY = "stop_strategy"
+GET_STATUS = "get_status"
+START_PROFILING = "start_profiling"
+STOP_PROFILING = "stop_profiling"
+
+COMMAND_SERVICES = {
+    START_STRATEGY: COMMAND_START,
+    STOP_STRATEGY: COMMAND_STOP,
+    GET_STATUS: COMMAND_STATUS,
+}
 
-SERVICE_IMPORT_STRATEGY_SCHEMA = vol.Schema(
+TARGET_SCHEMA = {
+    vol.Optional(ATTR_INSTANCE_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_TARGET_STRATEGY): cv.string,
+    vol.Optional(ATTR_TRADING_PAIR): cv.string,
+    vol.Optional(ATTR_TIMEOUT): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=MAX_COMMAND_TIMEOUT)),
+}
+
+SERVICE_COMMAND_SCHEMA = vol.All(
+    vol.Schema(TARGET_SCHEMA),
+    cv.has_at_least_one_key(ATTR_INSTANCE_ID, ATTR_TARGET_STRATEGY, ATTR_TRADING_PAIR),
+)
+
+SERVICE_IMPORT_STRATEGY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **TARGET_SCHEMA,
+            vol.Required(ATTR_STRATEGY_NAME): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_INSTANCE_ID, ATTR_TARGET_STRATEGY, ATTR_TRADING_PAIR),
+)
+
+SERVICE_START_PROFILING_SCHEMA = vol.Schema(
     {
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Optional(ATTR_STRATEGY_NAME): cv.string,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+        ),
     }
 )
 
 
+async def _async_send_bulk_command(
+    hass: HomeAssistant, service: ServiceCall, command: str, data: dict | None = None
+) -> ServiceResponse:
+    kwargs = service.data
+
+    return await HbotManager.instance().async_send_bulk_command(
+        hass,
+        command,
+        instance_ids=kwargs.get(ATTR_INSTANCE_ID),
+        strategy=kwargs.get(ATTR_TARGET_STRATEGY),
+        trading_pair=kwargs.get(ATTR_TRADING_PAIR),
+        data=data,
+        timeout=kwargs.get(ATTR_TIMEOUT),
+    )
+
+
 @callback
 def _async_register_import_strategy_service(hass: HomeAssistant) -> None:
-    async def async_handle_import_strategy_service(service: ServiceCall) -> None:
+    async def async_handle_import_strategy_service(service: ServiceCall) -> ServiceResponse:
         """Handle calls to the import_strategy service."""
-        kwargs = service.data
-        instance_id = kwargs.get(ATTR_INSTANCE_ID)
-        strategy_name = kwargs.get(ATTR_STRATEGY_NAME)
-        HbotManager.instance().send_import_command(hass, instance_id, strategy_name)
+        strategy_name = service.data.get(ATTR_STRATEGY_NAME)
+        return await _async_send_bulk_command(hass, service, COMMAND_IMPORT, {"strategy": strategy_name})
 
     hass.services.async_register(
         DOMAIN,
         IMPORT_STRATEGY,
         async_handle_import_strategy_service,
         schema=SERVICE_IMPORT_STRATEGY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def _async_register_command_service(hass: HomeAssistant, service_name: str, command: str) -> None:
+    async def async_handle_command_service(service: ServiceCall) -> ServiceResponse:
+        """Handle calls to the start, stop and status services."""
+        return await _async_send_bulk_command(hass, service, command)
+
+    hass.services.async_register(
+        DOMAIN,
+        service_name,
+        async_handle_command_service,
+        schema=SERVICE_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def _async_register_profiling_services(hass: HomeAssistant) -> None:
+    async def async_handle_start_profiling_service(service: ServiceCall) -> None:
+        """Handle calls to the start_profiling service."""
+        HbotManager.instance().profiler.async_start(hass, service.data[ATTR_DURATION])
+
+    async def async_handle_stop_profiling_service(service: ServiceCall) -> None:
+        """Handle calls to the stop_profiling service."""
+        await HbotManager.instance().profiler.async_stop(hass)
+
+    hass.services.async_register(
+        DOMAIN,
+        START_PROFILING,
+        async_handle_start_profiling_service,
+        schema=SERVICE_START_PROFILING_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        STOP_PROFILING,
+        async_handle_stop_profiling_service,
     )
 
 
@@ -40,3 +149,10 @@ def async_register_services(hass: HomeAssistant) -> None:
     """Register hummingbot services."""
     if not hass.services.has_service(DOMAIN, IMPORT_STRATEGY):
         _async_register_import_strategy_service(hass)
+
+    for service_name, command in COMMAND_SERVICES.items():
+        if not hass.services.has_service(DOMAIN, service_name):
+            _async_register_command_service(hass, service_name, command)
+
+    if not hass.services.has_service(DOMAIN, START_PROFILING):
+        _async_register_profiling_services(hass)
@@ -0,0 +1,116 @@
+"""Coalesce state writes for Hummingbot entities."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from .const import DEFAULT_STATE_WRITE_INTERVAL
+
+if TYPE_CHECKING:
+    from .base import HbotBase
+    from .profiler import HbotProfiler
+
+
+class HbotStateWriteScheduler:
+    """Throttle state writes to at most one per entity per write interval.
+
+    The first write after a quiet period goes out immediately, later writes
+    inside the interval are merged and flushed with the entity's latest value.
+    """
+
+    def __init__(self, write_interval: float = DEFAULT_STATE_WRITE_INTERVAL / 1000, profiler: HbotProfiler | None = None):
+        self._write_interval = write_interval
+        self._profiler = profiler
+        self._pending = dict()
+        self._last_written = dict()
+        self._flush_handle = None
+
+    @property
+    def write_interval(self) -> float:
+        return self._write_interval
+
+    def set_write_interval(self, write_interval: float) -> None:
+        self._write_interval = max(write_interval, 0.0)
+
+        if self._write_interval <= 0:
+            self.async_flush_all()
+
+    def async_schedule_write(self, entity: HbotBase) -> None:
+        time_now = time.monotonic()
+
+        if self._write_interval <= 0:
+            self._async_write(entity, time_now)
+            return
+
+        if entity not in self._pending:
+            last_written = self._last_written.get(entity)
+
+            if last_written is None or time_now - last_written >= self._write_interval:
+                self._async_write(entity, time_now)
+                return
+
+        self._pending[entity] = None
+        self._async_start_flush_timer(self._write_interval)
+
+    def async_forget(self, entity: HbotBase) -> None:
+        self._pending.pop(entity, None)
+        self._last_written.pop(entity, None)
+
+    def async_flush_all(self) -> None:
+        self._async_cancel_flush_timer()
+
+        time_now = time.monotonic()
+        pending = self._pending
+        self._pending = dict()
+
+        for entity in pending:
+            self._async_write(entity, time_now)
+
+    def unload(self) -> None:
+        self._async_cancel_flush_timer()
+        self._pending = dict()
+        self._last_written = dict()
+
+    def _async_write(self, entity: HbotBase, time_now: float) -> None:
+        self._last_written[entity] = time_now
+        entity.async_safe_write_ha_state()
+
+    def _async_flush_timer_fired(self) -> None:
+        self._flush_handle = None
+
+        if self._profiler is not None:
+            self._profiler.runcall(self._async_flush)
+        else:
+            self._async_flush()
+
+    def _async_flush(self) -> None:
+
+        time_now = time.monotonic()
+        next_due = None
+        pending = self._pending
+        self._pending = dict()
+
+        for entity in pending:
+            due = self._last_written.get(entity, 0.0) + self._write_interval
+
+            if due <= time_now:
+                self._async_write(entity, time_now)
+                continue
+
+            self._pending[entity] = None
+            next_due = due if next_due is None else min(next_due, due)
+
+        if next_due is not None:
+            self._async_start_flush_timer(next_due - time_now)
+
+    def _async_start_flush_timer(self, delay: float) -> None:
+        if self._flush_handle is not None:
+            return
+
+        self._flush_handle = asyncio.get_running_loop().call_later(delay, self._async_flush_timer_fired)
+
+    def _async_cancel_flush_timer(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
@@ -0,0 +1,305 @@
+"""Parser for the text returned by the Hummingbot `status` command."""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+_ASSETS_SECTIONS = frozenset(("Assets:", "Balances:"))
+_ORDERS_SECTIONS = frozenset(("Orders:", "orders:", "Active Orders:", "Active orders:"))
+_RE_MARKETS_HEADER = re.compile(r"Exchange\s+Market\b")
+_RE_BALANCES_HEADER = re.compile(r"Exchange\s+Asset\s+Total Balance\s+Available Balance\b")
+_RE_HEADER_BID = re.compile(r"\bBid\b")
+_RE_HEADER_ASK = re.compile(r"\bAsk\b")
+_RE_HEADER_MID = re.compile(r"\bMid(?:\s?Price)?\b|\bRef Price\b")
+# Cheap check before _to_floats, whose failures raise twice.
+_RE_NUMBERS_LINE = re.compile(r"[-+\d.,%eE\s]+")
+
+_STATE_NONE = 0
+_STATE_MARKETS = 1
+_STATE_ASSETS = 2
+_STATE_ASSET_COLUMNS = 3
+_STATE_BALANCES = 4
+_STATE_ORDERS = 5
+_STATE_ORDER_ROWS = 6
+
+_NO_ORDERS_LINE = "No active maker orders."
+
+_DEFAULT_PRICE_COLUMNS = (0, 1, 2)
+
+
+def _to_floats(values: list[str]) -> list[float] | None:
+    try:
+        floats = list(map(float, values))
+    except ValueError:
+        try:
+            floats = [float(v.replace(",", "").rstrip("%")) for v in values]
+        except ValueError:
+            return None
+
+    for value in floats:
+        if value != value:
+            return None
+
+    return floats
+
+
+@lru_cache(maxsize=32)
+def _market_price_columns(header: str) -> tuple[int, int, int]:
+    """Return the positions of bid, ask and mid among a market row's numbers."""
+    positions = list()
+
+    for pattern in (_RE_HEADER_BID, _RE_HEADER_ASK, _RE_HEADER_MID):
+        if (match := pattern.search(header)) is None:
+            return _DEFAULT_PRICE_COLUMNS
+        positions.append(match.start())
+
+    ranked = sorted(positions)
+
+    return tuple(ranked.index(position) for position in positions)
+
+
+@lru_cache(maxsize=32)
+def _order_columns(header: str) -> tuple[int, int, int | None] | None:
+    """Return the positions of side, price and market in an orders table row."""
+    columns = header.split()
+    side = next((i for i, column in enumerate(columns) if column in ("Side", "Type")), None)
+
+    if side is None or "Price" not in columns:
+        return None
+
+    return side, columns.index("Price"), columns.index("Market") if "Market" in columns else None
+
+
+def _order_row(cols: list[str], order_columns: tuple[int, int, int | None]) -> HbotStatusOrder | None:
+    side_column, price_column, market_column = order_columns
+
+    if len(cols) <= max(side_column, price_column, market_column or 0):
+        return None
+
+    side = cols[side_column].lower()
+    price_text = cols[price_column].replace(",", "")
+
+    if side not in ("buy", "sell"):
+        return None
+
+    try:
+        price = float(price_text)
+    except ValueError:
+        return None
+
+    decimals = len(price_text) - price_text.index(".") - 1 if "." in price_text else 0
+    # The cross exchange tables put the exchange under Market.
+    trading_pair = cols[market_column] if market_column is not None and "-" in cols[market_column] else None
+
+    return HbotStatusOrder(trading_pair, side, price, 0.5 * 10 ** -decimals)
+
+
+class HbotStatusMarket(NamedTuple):
+    connector: str
+    trading_pair: str
+    bid: float
+    ask: float
+    mid: float
+
+    @property
+    def base_asset(self) -> str:
+        return self.trading_pair.split("-")[0]
+
+    @property
+    def quote_asset(self) -> str | None:
+        pair_parts = self.trading_pair.split("-")
+        return pair_parts[1] if len(pair_parts) > 1 else None
+
+
+class HbotStatusBalance(NamedTuple):
+    connector: str | None
+    asset: str
+    total: float
+    available: float
+
+
+class HbotStatusOrder(NamedTuple):
+    trading_pair: str | None
+    side: str
+    price: float
+    tolerance: float
+
+    def matches(self, trading_pair: str, side: str, price: float) -> bool:
+        """Compare with an order, at the precision the price was printed with."""
+        return (
+            side == self.side
+            and (self.trading_pair is None or trading_pair == self.trading_pair)
+            and abs(price - self.price) <= self.tolerance
+        )
+
+
+class HbotStatus(NamedTuple):
+    markets: list[HbotStatusMarket]
+    balances: list[HbotStatusBalance]
+    assets: list[str]
+    # None when the status has no orders table at all.
+    order_lines: list[str] | None = None
+    order_columns: tuple[int, int, int | None] | None = None
+
+    @property
+    def orders(self) -> list[HbotStatusOrder] | None:
+        """Parse the orders table rows, up to the first that does not fit.
+
+        Only reconciling restored orders needs them, so the rows are kept as
+        text by parse_status and parsed here on each access.
+        """
+        if self.order_lines is None:
+            return None
+
+        orders = list()
+
+        for line in self.order_lines:
+            if (order := _order_row(line.split(), self.order_columns)) is None:
+                break
+
+            orders.append(order)
+
+        return orders
+
+    @property
+    def primary_market(self) -> HbotStatusMarket | None:
+        return self.markets[0] if self.markets else None
+
+    @property
+    def base_asset(self) -> str | None:
+        if len(self.assets) >= 2:
+            return self.assets[0]
+
+        return self.primary_market.base_asset if self.primary_market else None
+
+    @property
+    def quote_asset(self) -> str | None:
+        if len(self.assets) >= 2:
+            return self.assets[1]
+
+        return self.primary_market.quote_asset if self.primary_market else None
+
+    def get_balance(self, asset: str, connector: str | None = None) -> HbotStatusBalance | None:
+        for balance in self.balances:
+            if balance.asset == asset and (connector is None or balance.connector in (None, connector)):
+                return balance
+
+        return None
+
+
+def parse_status(text: str) -> HbotStatus:
+    """Parse a status message in a single pass.
+
+    Handles the `Assets:` block printed by the classic strategies as well as
+    the `Exchange Asset Total Balance Available Balance` tables and any number
+    of rows under an `Exchange Market ...` header, and the side and price of
+    the rows in an `Orders:` or `Active orders:` table. Lines that do not fit
+    the expected layout are skipped.
+    """
+    markets = list()
+    order_lines = None
+    order_columns = None
+    balances = list()
+    assets = list()
+    asset_totals = list()
+    asset_available = list()
+    price_columns = _DEFAULT_PRICE_COLUMNS
+    state = _STATE_NONE
+
+    for line in text.splitlines():
+        line = line.strip()
+
+        if not line:
+            if state != _STATE_ASSETS:
+                state = _STATE_NONE
+            continue
+
+        if state == _STATE_ORDERS:
+            order_columns = _order_columns(line)
+            state = _STATE_ORDER_ROWS if order_columns is not None else _STATE_NONE
+            continue
+
+        if line.startswith("Exchange"):
+            if _RE_MARKETS_HEADER.match(line):
+                price_columns = _market_price_columns(line)
+                state = _STATE_MARKETS
+                continue
+
+            if _RE_BALANCES_HEADER.match(line):
+                state = _STATE_BALANCES
+                continue
+
+        elif line[-1] == ":":
+            if line in _ASSETS_SECTIONS:
+                state = _STATE_ASSETS
+                continue
+
+            if line in _ORDERS_SECTIONS:
+                order_lines = list()
+                state = _STATE_ORDERS
+                continue
+
+        elif line == _NO_ORDERS_LINE:
+            order_lines = list()
+            continue
+
+        if state == _STATE_NONE:
+            continue
+
+        if state == _STATE_ORDER_ROWS:
+            order_lines.append(line)
+            continue
+
+        if state == _STATE_ASSET_COLUMNS:
+            if line.startswith("Total Balance"):
+                asset_totals = _to_floats(line.split()[2:]) or list()
+
+            elif line.startswith("Available Balance"):
+                asset_available = _to_floats(line.split()[2:]) or list()
+
+            continue
+
+        cols = line.split()
+
+        if state == _STATE_MARKETS:
+            prices = _to_floats(cols[2:5]) if len(cols) >= 5 else None
+
+            if prices is None:
+                state = _STATE_NONE
+                continue
+
+            bid_column, ask_column, mid_column = price_columns
+            markets.append(HbotStatusMarket(cols[0], cols[1], prices[bid_column], prices[ask_column], prices[mid_column]))
+
+        elif state == _STATE_BALANCES:
+            amounts = _to_floats(cols[2:4]) if len(cols) >= 4 else None
+
+            if amounts is None:
+                state = _STATE_NONE
+                continue
+
+            balances.append(HbotStatusBalance(cols[0], cols[1], amounts[0], amounts[1]))
+
+        elif state == _STATE_ASSETS:
+            if line.startswith(("Total Balance", "Available Balance")) or (
+                _RE_NUMBERS_LINE.fullmatch(line) and _to_floats(cols) is not None
+            ):
+                state = _STATE_NONE
+                continue
+
+            assets = cols
+            state = _STATE_ASSET_COLUMNS
+
+    if assets:
+        connector = markets[0].connector if len(markets) == 1 else None
+
+        for i, asset in enumerate(assets):
+            if i >= len(asset_totals) and i >= len(asset_available):
+                break
+
+            total = asset_totals[i] if i < len(asset_totals) else 0.0
+            available = asset_available[i] if i < len(asset_available) else 0.0
+            balances.append(HbotStatusBalance(connector, asset, total, available))
+
+    return HbotStatus(markets, balances, assets, order_lines, order_columns)
@@ -0,0 +1,99 @@
+"""Fleet-wide status polling for Hummingbot instances."""
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import TYPE_CHECKING
+
+from .const import (
+    DEFAULT_STATUS_UPDATE_INTERVAL,
+    STATUS_POLL_BACKOFF,
+    STATUS_POLL_JITTER,
+    STATUS_POLL_MAX_BACKOFF,
+    STATUS_POLL_MIN_INTERVAL,
+)
+from .deadline_scheduler import HbotDeadlineScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class HbotStatusPollScheduler(HbotDeadlineScheduler):
+    """Request status from running instances, spread out over time.
+
+    Each instance starts at a random offset inside the interval and every
+    poll is jittered so the fleet never replies in lockstep. Instances poll
+    at the minimum interval while prices are missing, at the configured
+    interval while the status changes and back off while it does not.
+    """
+
+    def __init__(
+        self,
+        on_poll: Callable[[str], None],
+        interval: float = DEFAULT_STATUS_UPDATE_INTERVAL,
+    ):
+        super().__init__()
+        self._on_poll = on_poll
+        self._interval = interval
+        self._intervals = dict()
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def max_interval(self) -> float:
+        return self._interval * STATUS_POLL_MAX_BACKOFF
+
+    def get_interval(self, instance_id: str) -> float | None:
+        return self._intervals.get(instance_id)
+
+    def set_interval(self, interval: float) -> None:
+        self._interval = interval
+
+        for instance_id, instance_interval in self._intervals.items():
+            self._intervals[instance_id] = min(max(instance_interval, STATUS_POLL_MIN_INTERVAL), self.max_interval)
+
+    def async_add(self, instance_id: str) -> None:
+        if instance_id in self._deadlines:
+            return
+
+        self._intervals[instance_id] = STATUS_POLL_MIN_INTERVAL
+        self._async_schedule(instance_id, random.uniform(0, STATUS_POLL_MIN_INTERVAL))
+
+    def async_remove(self, instance_id: str) -> None:
+        super().async_remove(instance_id)
+        self._intervals.pop(instance_id, None)
+
+    def async_report(self, instance_id: str, changed: bool, prices_missing: bool) -> None:
+        if (interval := self._intervals.get(instance_id)) is None:
+            return
+
+        if prices_missing:
+            interval = STATUS_POLL_MIN_INTERVAL
+        elif changed:
+            interval = self._interval
+        else:
+            interval = min(max(interval, self._interval) * STATUS_POLL_BACKOFF, self.max_interval)
+
+        self._intervals[instance_id] = interval
+        self._async_schedule(instance_id, self._jittered(interval))
+
+    def unload(self) -> None:
+        super().unload()
+        self._intervals = dict()
+
+    @staticmethod
+    def _jittered(interval: float) -> float:
+        return interval * random.uniform(1 - STATUS_POLL_JITTER, 1 + STATUS_POLL_JITTER)
+
+    def _async_schedule(self, instance_id: str, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        self._async_set_deadline(instance_id, loop.time() + delay, loop)
+
+    def _async_expired(self, instance_ids: list[str]) -> None:
+        for instance_id in instance_ids:
+            self._async_schedule(instance_id, self._jittered(self._intervals[instance_id]))
+
+        for instance_id in instance_ids:
+            self._on_poll(instance_id)
@@ -0,0 +1,267 @@
+"""Rolling trade aggregates for Hummingbot instances."""
+from __future__ import annotations
+
+from typing import Any
+
+from .fills import HbotFill
+
+
+class HbotTradeTotals:
+    __slots__ = ("count", "base_volume", "quote_volume", "fees", "realized_pnl")
+
+    def __init__(self):
+        self.count = 0
+        self.base_volume = 0.0
+        self.quote_volume = 0.0
+        self.fees = 0.0
+        self.realized_pnl = 0.0
+
+    def add(self, other: HbotTradeTotals, sign: int = 1) -> None:
+        self.count += sign * other.count
+        self.base_volume += sign * other.base_volume
+        self.quote_volume += sign * other.quote_volume
+        self.fees += sign * other.fees
+        self.realized_pnl += sign * other.realized_pnl
+
+    @property
+    def data_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "base_volume": self.base_volume,
+            "quote_volume": self.quote_volume,
+            "fees": self.fees,
+            "realized_pnl": self.realized_pnl,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        self.count = int(data.get("count", 0))
+        self.base_volume = float(data.get("base_volume", 0.0))
+        self.quote_volume = float(data.get("quote_volume", 0.0))
+        self.fees = float(data.get("fees", 0.0))
+        self.realized_pnl = float(data.get("realized_pnl", 0.0))
+
+
+class HbotRollingWindow:
+    """Totals over a sliding window, kept in a ring of fixed width buckets.
+
+    Adding a fill touches one bucket and the running totals. Buckets that
+    leave the window are subtracted as time advances, each exactly once.
+    """
+
+    def __init__(self, window: int, bucket_width: int):
+        self._bucket_width = bucket_width
+        self._size = max(window // bucket_width, 1)
+        self._buckets = [None] * self._size
+        self._totals = HbotTradeTotals()
+        self._current_index = None
+
+    @property
+    def totals(self) -> HbotTradeTotals:
+        return self._totals
+
+    def next_expiry(self) -> float | None:
+        if self._current_index is None:
+            return None
+
+        return (self._current_index + 1) * self._bucket_width
+
+    @property
+    def snapshot_data(self) -> dict[str, Any]:
+        return {
+            "current_index": self._current_index,
+            "buckets": [[bucket[0], bucket[1].data_dict] for bucket in self._buckets if bucket is not None],
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load saved buckets, the next advance expires the ones that left the window."""
+        self._current_index = data.get("current_index")
+
+        for index, totals_data in data.get("buckets", list()):
+            totals = HbotTradeTotals()
+            totals.restore(totals_data)
+
+            self._buckets[index % self._size] = (index, totals)
+            self._totals.add(totals)
+
+    def add(self, totals: HbotTradeTotals, time_now: float) -> None:
+        self.advance(time_now)
+
+        index = self._current_index
+        slot = index % self._size
+
+        if (bucket := self._buckets[slot]) is None or bucket[0] != index:
+            bucket = self._buckets[slot] = (index, HbotTradeTotals())
+
+        bucket[1].add(totals)
+        self._totals.add(totals)
+
+    def advance(self, time_now: float) -> bool:
+        """Move the window to time_now, return whether any bucket expired."""
+        index = int(time_now // self._bucket_width)
+
+        if self._current_index is None:
+            self._current_index = index
+            return False
+
+        if index <= self._current_index:
+            return False
+
+        expired = False
+
+        first_index = self._current_index - self._size + 1
+        last_index = min(self._current_index, index - self._size)
+
+        for expired_index in range(first_index, last_index + 1):
+            slot = expired_index % self._size
+
+            if (bucket := self._buckets[slot]) is not None and bucket[0] == expired_index:
+                self._totals.add(bucket[1], -1)
+                self._buckets[slot] = None
+                expired = True
+
+        self._current_index = index
+
+        if expired and self._totals.count == 0:
+            self._totals = HbotTradeTotals()
+
+        return expired
+
+
+class HbotPosition:
+    """Average cost position of one trading pair, used for realized PnL."""
+
+    __slots__ = ("amount", "avg_price")
+
+    def __init__(self):
+        self.amount = 0.0
+        self.avg_price = 0.0
+
+    @property
+    def data_dict(self) -> dict[str, float]:
+        return {
+            "amount": self.amount,
+            "avg_price": self.avg_price,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        self.amount = float(data.get("amount", 0.0))
+        self.avg_price = float(data.get("avg_price", 0.0))
+
+    def apply(self, side: str, amount: float, price: float) -> float:
+        """Apply a fill and return the PnL it realized, before fees."""
+        signed_amount = amount if side == "buy" else -amount
+
+        if self.amount == 0 or (self.amount > 0) == (signed_amount > 0):
+            total = abs(self.amount) + amount
+            self.avg_price = (self.avg_price * abs(self.amount) + price * amount) / total
+            self.amount += signed_amount
+            return 0.0
+
+        closed = min(amount, abs(self.amount))
+        realized = closed * (price - self.avg_price) * (1 if self.amount > 0 else -1)
+
+        self.amount += signed_amount
+
+        if abs(self.amount) < 1e-12:
+            self.amount = 0.0
+            self.avg_price = 0.0
+        elif amount > closed:
+            self.avg_price = price
+
+        return realized
+
+
+class HbotTradeStats:
+    """Fill count, volumes, fees and realized PnL over rolling windows.
+
+    Totals are kept per quote asset, fills of pairs quoted in different assets
+    are never summed. Fees and PnL are in that quote asset, fees paid in other
+    tokens are not converted and left out.
+    """
+
+    def __init__(self, windows: dict[str, tuple[int, int]]):
+        self._window_sizes = windows
+        self._windows = dict()
+        self._positions = dict()
+        self._next_expiry = None
+
+    def totals(self, window_name: str) -> dict[str, HbotTradeTotals]:
+        """Return the totals of a window per quote asset, in order of first fill."""
+        return {quote_asset: windows[window_name].totals for quote_asset, windows in self._windows.items()}
+
+    @property
+    def snapshot_data(self) -> dict[str, Any]:
+        return {
+            "windows": {
+                quote_asset: {name: window.snapshot_data for name, window in windows.items()}
+                for quote_asset, windows in self._windows.items()
+            },
+            "positions": {trading_pair: position.data_dict for trading_pair, position in self._positions.items()},
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        for quote_asset, windows_data in data.get("windows", dict()).items():
+            windows = self._get_windows(quote_asset)
+
+            for name, window_data in windows_data.items():
+                if (window := windows.get(name)) is not None:
+                    window.restore(window_data)
+
+        for trading_pair, position_data in data.get("positions", dict()).items():
+            self._get_position(trading_pair).restore(position_data)
+
+        self._update_next_expiry()
+
+    def add_fill(self, fill: HbotFill, time_now: float) -> None:
+        position = self._get_position(fill.trading_pair)
+        windows = self._get_windows(fill.quote_asset)
+
+        fees = fill.fee_in(fill.quote_asset) + fill.fee_in(fill.base_asset) * fill.price
+
+        totals = HbotTradeTotals()
+        totals.count = 1
+        totals.base_volume = fill.amount
+        totals.quote_volume = fill.notional
+        totals.fees = fees
+        totals.realized_pnl = position.apply(fill.side, fill.amount, fill.price) - fees
+
+        for window in windows.values():
+            window.add(totals, time_now)
+
+        self._update_next_expiry()
+
+    def advance(self, time_now: float) -> bool:
+        """Expire old buckets, cheap when nothing is due. Return whether totals changed."""
+        if self._next_expiry is None or time_now < self._next_expiry:
+            return False
+
+        expired = False
+
+        for windows in self._windows.values():
+            for window in windows.values():
+                expired = window.advance(time_now) or expired
+
+        self._update_next_expiry()
+
+        return expired
+
+    def _get_position(self, trading_pair: str) -> HbotPosition:
+        if (position := self._positions.get(trading_pair)) is None:
+            position = self._positions[trading_pair] = HbotPosition()
+
+        return position
+
+    def _get_windows(self, quote_asset: str) -> dict[str, HbotRollingWindow]:
+        if (windows := self._windows.get(quote_asset)) is None:
+            windows = self._windows[quote_asset] = {
+                name: HbotRollingWindow(window, bucket_width) for name, (window, bucket_width) in self._window_sizes.items()
+            }
+
+        return windows
+
+    def _update_next_expiry(self) -> None:
+        expiries = [
+            expiry for windows in self._windows.values() for window in windows.values()
+            if (expiry := window.next_expiry()) is not None
+        ]
+        self._next_expiry = min(expiries) if expiries else None